@@ -0,0 +1,151 @@
+import os
+import time
+import orjson
+import logging
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+try:
+    import redis.asyncio as redis
+except ImportError:
+    redis = None
+
+logger = logging.getLogger(__name__)
+
+# Redis key prefix for job records and channel for cross-worker progress updates
+JOB_KEY_PREFIX = "job:"
+PROGRESS_CHANNEL = "channel:progress"
+
+# Sorted set of finished job IDs scored by finish time, used to evict old jobs
+FINISHED_JOBS_KEY = "jobs:finished"
+
+# Finished jobs are retained up to this many (in memory) or for this long (Redis)
+MAX_FINISHED_JOBS = 10000
+FINISHED_JOB_TTL_SECONDS = 24 * 3600
+FINISHED_STATUSES = {"completed", "failed", "cancelled"}
+
+def remove_job_output(job_id: str, job: Optional[Dict[str, Any]]):
+    """Delete the output file of an evicted job, if it has one"""
+    file_path = job.get("file_path") if job else None
+    if file_path:
+        try:
+            os.unlink(file_path)
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            logger.error(f"Failed to remove output of evicted job {job_id}: {e}")
+
+class InMemoryJobStore:
+    """Job store backed by per-process dicts (only valid for a single worker)
+
+    Active jobs are kept until they finish; finished jobs move to an LRU
+    bounded by max_finished_jobs, and evicted jobs have their output deleted.
+    """
+
+    def __init__(self, max_finished_jobs: int = MAX_FINISHED_JOBS):
+        self.max_finished_jobs = max_finished_jobs
+        self.jobs: Dict[str, Dict[str, Any]] = {}
+        self.finished_jobs: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+
+    async def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """Get a job record by ID"""
+        job = self.jobs.get(job_id)
+        if job is None and job_id in self.finished_jobs:
+            job = self.finished_jobs[job_id]
+            self.finished_jobs.move_to_end(job_id)
+        return job
+
+    async def create(self, job_id: str, job: Dict[str, Any]):
+        """Store a new job record"""
+        self.jobs[job_id] = job
+
+    async def update(self, job_id: str, fields: Dict[str, Any]):
+        """Update fields of an existing job record"""
+        job = self.jobs.get(job_id)
+        if job is None:
+            job = self.finished_jobs.get(job_id)
+            if job is not None:
+                job.update(fields)
+            return
+
+        job.update(fields)
+        if job.get("status") in FINISHED_STATUSES:
+            self.finished_jobs[job_id] = self.jobs.pop(job_id)
+            self._evict_finished_jobs()
+
+    def _evict_finished_jobs(self):
+        """Drop least recently used finished jobs and their output files"""
+        while len(self.finished_jobs) > self.max_finished_jobs:
+            job_id, job = self.finished_jobs.popitem(last=False)
+            remove_job_output(job_id, job)
+
+    async def sweep(self):
+        """Evict finished jobs beyond the retention limit"""
+        self._evict_finished_jobs()
+
+class RedisJobStore:
+    """Job store backed by Redis so every API worker sees the same jobs
+
+    Finished jobs are tracked in a sorted set by finish time; jobs older than
+    finished_job_ttl or beyond max_finished_jobs are deleted along with their
+    output files whenever a job finishes (and on sweep()).
+    """
+
+    def __init__(self, client, max_finished_jobs: int = MAX_FINISHED_JOBS,
+                 finished_job_ttl: float = FINISHED_JOB_TTL_SECONDS):
+        self.client = client
+        self.max_finished_jobs = max_finished_jobs
+        self.finished_job_ttl = finished_job_ttl
+
+    def _key(self, job_id: str) -> str:
+        return f"{JOB_KEY_PREFIX}{job_id}"
+
+    async def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """Get a job record by ID"""
+        data = await self.client.get(self._key(job_id))
+        return orjson.loads(data) if data else None
+
+    async def create(self, job_id: str, job: Dict[str, Any]):
+        """Store a new job record"""
+        await self.client.set(self._key(job_id), orjson.dumps(job))
+
+    async def update(self, job_id: str, fields: Dict[str, Any]):
+        """Update fields of an existing job record"""
+        # Only the worker running a job writes to it, so read-modify-write is safe
+        job = await self.get(job_id)
+        if job is None:
+            return
+
+        job.update(fields)
+        await self.client.set(self._key(job_id), orjson.dumps(job))
+        if job.get("status") in FINISHED_STATUSES:
+            # Keeps the first finish time if a finished job is updated again
+            await self.client.zadd(FINISHED_JOBS_KEY, {job_id: time.time()}, nx=True)
+            await self.sweep()
+
+    async def sweep(self):
+        """Evict finished jobs that are too old or beyond the retention limit"""
+        expired = await self.client.zrangebyscore(FINISHED_JOBS_KEY, "-inf", time.time() - self.finished_job_ttl)
+        for job_id in expired:
+            # Only the worker whose ZREM succeeds evicts the job
+            if await self.client.zrem(FINISHED_JOBS_KEY, job_id):
+                await self._evict(job_id)
+
+        excess = await self.client.zcard(FINISHED_JOBS_KEY) - self.max_finished_jobs
+        if excess > 0:
+            for job_id, _ in await self.client.zpopmin(FINISHED_JOBS_KEY, excess):
+                await self._evict(job_id)
+
+    async def _evict(self, job_id: str):
+        """Delete a job record and its output file"""
+        remove_job_output(job_id, await self.get(job_id))
+        await self.client.delete(self._key(job_id))
+
+def create_redis_client(redis_url: Optional[str]):
+    """Create a Redis client, or None if Redis isn't configured or installed"""
+    if not redis_url:
+        return None
+    if redis is None:
+        logger.warning("REDIS_URL is set but the redis package is not installed, using in-memory job store")
+        return None
+    return redis.from_url(redis_url, decode_responses=True)
@@ -1,27 +1,44 @@
 from fastapi import FastAPI, HTTPException, WebSocket, WebSocketDisconnect
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
 import uvicorn
 import os
-from typing import List, Optional
-import json
+from typing import Any, Dict, List, Optional, Set
+import orjson
 import asyncio
 import logging
+from contextlib import asynccontextmanager
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 import sys
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from core.text_to_3d.model_manager import get_model_manager
 from core.mesh_processing.mesh_utils import MeshProcessor
+from api.utils import ModelCache, model_cache
+from api.job_store import InMemoryJobStore, RedisJobStore, create_redis_client, PROGRESS_CHANNEL
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Set up the job store on startup and release shared resources on shutdown"""
+    await setup_job_store()
+    try:
+        yield
+    finally:
+        await close_job_store()
+        shutdown_generation_executor()
+
 app = FastAPI(
     title="AI 3D Generator API",
     description="Generate 3D models from text descriptions using AI",
-    version="0.1.0"
+    version="0.1.0",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan
 )
 
 # Configure CORS
@@ -33,24 +50,91 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+def serialize_message(data: dict) -> str:
+    """Serialize a WebSocket payload to JSON"""
+    return orjson.dumps(data).decode()
+
+def pack_messages(messages: List[str]) -> str:
+    """Combine already-serialized payloads into one multi-item frame"""
+    return '{"type":"multi","items":[' + ",".join(messages) + "]}"
+
+# Max clients queued to per event-loop tick during a broadcast
+BROADCAST_BATCH_SIZE = 50
+# Minimum seconds between frames to one client; updates in between are batched
+BROADCAST_FLUSH_INTERVAL = 0.1
+
 # WebSocket connection manager
 class ConnectionManager:
     def __init__(self):
-        self.active_connections: List[WebSocket] = []
+        self.active_connections: Set[WebSocket] = set()
+        # Per client: latest unsent payload keyed by job, plus a wake-up event
+        self._pending: Dict[WebSocket, Dict[Any, str]] = {}
+        self._events: Dict[WebSocket, asyncio.Event] = {}
+        self._writers: Dict[WebSocket, asyncio.Task] = {}
 
     async def connect(self, websocket: WebSocket):
         await websocket.accept()
-        self.active_connections.append(websocket)
+        self.active_connections.add(websocket)
+        self._pending[websocket] = {}
+        self._events[websocket] = asyncio.Event()
+        self._writers[websocket] = asyncio.create_task(self._writer(websocket))
 
     def disconnect(self, websocket: WebSocket):
-        self.active_connections.remove(websocket)
+        # Safe to call more than once (endpoint exit and failed writes both prune)
+        self.active_connections.discard(websocket)
+        self._pending.pop(websocket, None)
+        self._events.pop(websocket, None)
+        writer = self._writers.pop(websocket, None)
+        if writer is not None and writer is not asyncio.current_task():
+            writer.cancel()
+
+    async def _writer(self, websocket: WebSocket):
+        """Send pending payloads so slow sockets only delay themselves"""
+        event = self._events[websocket]
+        while True:
+            await event.wait()
+            event.clear()
+            pending = self._pending.get(websocket)
+            if pending is None:
+                return
+            self._pending[websocket] = {}
+            messages = list(pending.values())
+            try:
+                if len(messages) == 1:
+                    await websocket.send_text(messages[0])
+                else:
+                    await websocket.send_text(pack_messages(messages))
+            except Exception as e:
+                logger.warning(f"Dropping WebSocket client after failed send: {e}")
+                self.disconnect(websocket)
+                return
+            # Throttle so bursts of updates go out as one frame
+            await asyncio.sleep(BROADCAST_FLUSH_INTERVAL)
 
     async def send_personal_message(self, message: str, websocket: WebSocket):
         await websocket.send_text(message)
 
-    async def broadcast(self, message: str):
-        for connection in self.active_connections:
-            await connection.send_text(message)
+    async def broadcast_json(self, data: dict):
+        """Serialize once and send the same payload to every client"""
+        await self.broadcast(serialize_message(data), job_id=data.get("job_id"))
+
+    async def broadcast(self, message: str, job_id: Optional[str] = None):
+        # Progress for a job is superseded by newer frames, so a client that
+        # hasn't caught up only ever holds the latest one per job
+        key = job_id if job_id is not None else object()
+        connections = list(self._pending)
+
+        # Large fan-outs are queued in slices, yielding to the loop between them
+        # so HTTP requests aren't starved during progress broadcasts
+        for start in range(0, len(connections), BROADCAST_BATCH_SIZE):
+            if start:
+                await asyncio.sleep(0)
+            for connection in connections[start:start + BROADCAST_BATCH_SIZE]:
+                pending = self._pending.get(connection)
+                if pending is None:
+                    continue
+                pending[key] = message
+                self._events[connection].set()
 
 manager = ConnectionManager()
 
@@ -73,8 +157,67 @@ class ModelInfo(BaseModel):
     description: str
     available: bool
 
-# In-memory storage for demo (replace with database in production)
-generation_jobs = {}
+# Job storage; swapped for Redis at startup when REDIS_URL is set so that
+# every uvicorn worker sees the same jobs and progress updates
+generation_jobs = InMemoryJobStore()
+redis_client = None
+_progress_forwarder = None
+
+# Seconds to wait before resubscribing after the progress subscription fails
+PROGRESS_RESUBSCRIBE_DELAY = 1.0
+
+async def setup_job_store():
+    global generation_jobs, redis_client, _progress_forwarder
+    redis_client = create_redis_client(os.getenv("REDIS_URL"))
+    if redis_client is not None:
+        generation_jobs = RedisJobStore(redis_client)
+        # Clean up jobs that expired while no worker was running
+        await generation_jobs.sweep()
+        _progress_forwarder = asyncio.create_task(forward_progress_updates())
+        logger.info("Using Redis for generation jobs and progress updates")
+
+async def close_job_store():
+    global redis_client, _progress_forwarder
+    if _progress_forwarder is not None:
+        _progress_forwarder.cancel()
+        _progress_forwarder = None
+    if redis_client is not None:
+        await redis_client.aclose()
+        redis_client = None
+
+async def publish_progress(data: dict):
+    """Send a job update to WebSocket clients on every worker"""
+    if redis_client is not None:
+        await redis_client.publish(PROGRESS_CHANNEL, serialize_message(data))
+    else:
+        await manager.broadcast_json(data)
+
+async def forward_progress_updates():
+    """Relay progress published by any worker, resubscribing if Redis fails"""
+    while True:
+        try:
+            await _relay_progress_updates()
+        except Exception as e:
+            logger.error(f"Progress subscription failed, resubscribing in {PROGRESS_RESUBSCRIBE_DELAY}s: {e}")
+        await asyncio.sleep(PROGRESS_RESUBSCRIBE_DELAY)
+
+async def _relay_progress_updates():
+    """Forward messages on the progress channel to this worker's WebSocket clients"""
+    pubsub = redis_client.pubsub()
+    try:
+        await pubsub.subscribe(PROGRESS_CHANNEL)
+        async for message in pubsub.listen():
+            if message["type"] != "message":
+                continue
+            payload = message["data"]
+            try:
+                job_id = orjson.loads(payload).get("job_id")
+            except orjson.JSONDecodeError:
+                logger.warning(f"Dropping malformed progress update: {payload!r}")
+                continue
+            await manager.broadcast(payload, job_id=job_id)
+    finally:
+        await pubsub.aclose()
 
 # Health check endpoint
 @app.get("/")
@@ -126,14 +269,14 @@ async def generate_3d_model(request: GenerationRequest):
         raise HTTPException(status_code=400, detail="Invalid model type")
 
     # Store generation job
-    generation_jobs[job_id] = {
+    await generation_jobs.create(job_id, {
         "id": job_id,
         "prompt": request.prompt,
         "model_type": request.model_type,
         "status": "queued",
         "progress": 0,
         "created_at": "2024-01-01T00:00:00Z"  # Replace with actual timestamp
-    }
+    })
 
     # Start async generation (placeholder)
     asyncio.create_task(process_generation(job_id, request))
@@ -149,22 +292,22 @@ async def process_generation(job_id: str, request: GenerationRequest):
     """Process the 3D generation (placeholder implementation)"""
     try:
         # Update status to processing
-        generation_jobs[job_id]["status"] = "processing"
-        await manager.broadcast(json.dumps({
+        await generation_jobs.update(job_id, {"status": "processing"})
+        await publish_progress({
             "job_id": job_id,
             "status": "processing",
             "progress": 10
-        }))
+        })
 
         # Simulate processing time
         for progress in [25, 50, 75, 90]:
             await asyncio.sleep(1)
-            generation_jobs[job_id]["progress"] = progress
-            await manager.broadcast(json.dumps({
+            await generation_jobs.update(job_id, {"progress": progress})
+            await publish_progress({
                 "job_id": job_id,
                 "status": "processing",
                 "progress": progress
-            }))
+            })
 
         # Generate 3D model using AI
         try:
@@ -175,50 +318,114 @@ async def process_generation(job_id: str, request: GenerationRequest):
                 request.format
             )
 
-            generation_jobs[job_id].update({
+            await generation_jobs.update(job_id, {
                 "status": "completed",
                 "progress": 100,
                 "file_path": output_file
             })
 
-            await manager.broadcast(json.dumps({
+            await publish_progress({
                 "job_id": job_id,
                 "status": "completed",
                 "progress": 100,
                 "message": f"Generated 3D model for: {request.prompt}"
-            }))
+            })
 
         except Exception as model_error:
             logger.error(f"Model generation failed for {job_id}: {model_error}")
-            generation_jobs[job_id].update({
+            await generation_jobs.update(job_id, {
                 "status": "failed",
                 "progress": 0,
                 "error": str(model_error)
             })
 
-            await manager.broadcast(json.dumps({
+            await publish_progress({
                 "job_id": job_id,
                 "status": "failed",
                 "progress": 0,
                 "message": f"Generation failed: {str(model_error)}"
-            }))
+            })
 
     except Exception as e:
-        generation_jobs[job_id].update({
+        await generation_jobs.update(job_id, {
             "status": "failed",
             "progress": 0,
             "error": str(e)
         })
 
-        await manager.broadcast(json.dumps({
+        await publish_progress({
             "job_id": job_id,
             "status": "failed",
             "progress": 0,
             "message": f"Generation failed: {str(e)}"
-        }))
+        })
+
+# Process pool for CPU-bound generation so the event loop stays responsive
+GENERATION_WORKERS = os.cpu_count() or 1
+_generation_executor = None
+
+def _init_generation_worker():
+    """Load the model manager once per worker process"""
+    get_model_manager()
+
+def get_generation_executor() -> ProcessPoolExecutor:
+    """Get the global generation process pool"""
+    global _generation_executor
+    if _generation_executor is None:
+        _generation_executor = ProcessPoolExecutor(
+            max_workers=GENERATION_WORKERS,
+            initializer=_init_generation_worker
+        )
+    return _generation_executor
+
+# Per worker process thread used to validate a mesh while it is being saved
+_validation_executor = None
+
+def get_validation_executor() -> ThreadPoolExecutor:
+    """Get the validation thread pool of the current process"""
+    global _validation_executor
+    if _validation_executor is None:
+        _validation_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="validate")
+    return _validation_executor
+
+def shutdown_generation_executor():
+    global _generation_executor
+    if _generation_executor is not None:
+        _generation_executor.shutdown(cancel_futures=True)
+        _generation_executor = None
+
+# Model types whose output depends only on (prompt, format), so files can be reused
+CACHEABLE_MODEL_TYPES = {"demo"}
 
 async def create_ai_generated_model(prompt: str, job_id: str, model_type: str, format: str = "stl") -> str:
     """Generate 3D model using AI and save to file"""
+    # Identical requests to a deterministic model produce identical meshes,
+    # reuse a previous file
+    cacheable = model_type in CACHEABLE_MODEL_TYPES
+    cache_key = ModelCache.make_key(prompt, model_type, format)
+    cached_file = model_cache.get(cache_key) if cacheable else None
+    if cached_file:
+        cached_name = os.path.basename(cached_file).split("_", 1)[1]
+        output_file = os.path.join(os.path.dirname(cached_file), f"{job_id}_{cached_name}")
+        ModelCache.link_or_copy(cached_file, output_file)
+        logger.info(f"Reused cached 3D model for {job_id}: {output_file}")
+        return output_file
+
+    loop = asyncio.get_running_loop()
+    output_file = await loop.run_in_executor(
+        get_generation_executor(),
+        _generate_model_file,
+        prompt,
+        job_id,
+        model_type,
+        format
+    )
+    if cacheable:
+        model_cache.put(cache_key, output_file)
+    return output_file
+
+def _generate_model_file(prompt: str, job_id: str, model_type: str, format: str = "stl") -> str:
+    """Generate 3D model using AI and save to file (runs in a worker process)"""
     try:
         # Create output directory
         output_dir = "generated_models"
@@ -236,17 +443,18 @@ async def create_ai_generated_model(prompt: str, job_id: str, model_type: str, f
         faces = result["faces"]
         metadata = result.get("metadata", {})
 
-        # Validate and process mesh
-        validation = MeshProcessor.validate_mesh(vertices, faces)
-        if not validation["is_valid"]:
-            logger.warning(f"Mesh validation issues: {validation['errors']}")
-
-        # Create STL mesh
-        stl_mesh = MeshProcessor.create_mesh_from_arrays(vertices, faces)
+        # Validate in a background thread while saving; NumPy releases the GIL
+        validation_future = get_validation_executor().submit(
+            MeshProcessor.validate_mesh, vertices, faces, trusted=metadata.get("trusted", False)
+        )
 
-        # Save to file
+        # Save to file (the STL mesh is only built when saving as STL)
         output_file = f"{output_dir}/{job_id}_{model_type}_{metadata.get('shape_type', 'model')}.{format}"
-        success = MeshProcessor.save_mesh(stl_mesh, output_file, format)
+        success = MeshProcessor.save_mesh(None, output_file, format, vertices=vertices, faces=faces)
+
+        validation = validation_future.result()
+        if not validation["is_valid"]:
+            logger.warning(f"Mesh validation issues: {validation['errors']}")
 
         if not success:
             raise Exception(f"Failed to save mesh to {output_file}")
@@ -263,10 +471,10 @@ async def create_ai_generated_model(prompt: str, job_id: str, model_type: str, f
 @app.get("/generate/{job_id}")
 async def get_generation_status(job_id: str):
     """Get status of a 3D generation job"""
-    if job_id not in generation_jobs:
+    job = await generation_jobs.get(job_id)
+    if job is None:
         raise HTTPException(status_code=404, detail="Generation job not found")
 
-    job = generation_jobs[job_id]
     return GenerationResponse(
         id=job_id,
         status=job["status"],
@@ -278,10 +486,10 @@ async def get_generation_status(job_id: str):
 @app.get("/download/{job_id}")
 async def download_generated_model(job_id: str):
     """Download generated 3D model file"""
-    if job_id not in generation_jobs:
+    job = await generation_jobs.get(job_id)
+    if job is None:
         raise HTTPException(status_code=404, detail="Generation job not found")
 
-    job = generation_jobs[job_id]
     if job["status"] != "completed" or "file_path" not in job:
         raise HTTPException(status_code=400, detail="Model not ready for download")
 
@@ -308,6 +516,10 @@ async def websocket_endpoint(websocket: WebSocket):
             # Echo received message (can be extended for client commands)
             await manager.send_personal_message(f"Received: {data}", websocket)
     except WebSocketDisconnect:
+        pass
+    except Exception as e:
+        logger.warning(f"WebSocket connection error: {e}")
+    finally:
         manager.disconnect(websocket)
 
 # Gallery endpoints (placeholder)
@@ -343,5 +555,9 @@ if __name__ == "__main__":
         host="0.0.0.0",
         port=8000,
         reload=True,
+        # uvloop/httptools ship with uvicorn[standard]; uvloop has no Windows build
+        loop="asyncio" if sys.platform == "win32" else "uvloop",
+        http="httptools",
+        ws="websockets",
         log_level="info"
     )
\ No newline at end of file
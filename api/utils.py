@@ -2,6 +2,9 @@ import os
 import uuid
 import hashlib
 import asyncio
+import shutil
+from collections import OrderedDict
+from functools import lru_cache
 from typing import Optional, Dict, Any, List
 from pathlib import Path
 import numpy as np
@@ -9,10 +12,47 @@ from stl import mesh
 import trimesh
 import logging
 
+from core.mesh_processing.mesh_utils import MeshProcessor as CoreMeshProcessor, is_edge_manifold
+from core.text_to_3d.base_model import _compile_keywords, _lookup_keyword
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Binary STL layout: 80-byte header, uint32 triangle count, 50 bytes per triangle
+STL_HEADER_SIZE = 84
+
+def load_stl_fast(path: str) -> mesh.Mesh:
+    """Load an STL with a single read() and a zero-copy view over the buffer"""
+    with open(path, "rb") as fh:
+        data = bytearray(os.fstat(fh.fileno()).st_size)
+        fh.readinto(data)
+
+    if len(data) >= STL_HEADER_SIZE:
+        count = int(np.frombuffer(data, dtype="<u4", count=1, offset=80)[0])
+        if len(data) == STL_HEADER_SIZE + count * mesh.Mesh.dtype.itemsize:
+            triangles = np.frombuffer(data, dtype=mesh.Mesh.dtype, count=count, offset=STL_HEADER_SIZE)
+            return mesh.Mesh(triangles, calculate_normals=False)
+
+    # Not a well-formed binary STL (e.g. ASCII), let numpy-stl parse it
+    return mesh.Mesh.from_file(path)
+
+# Primitive topology only depends on resolution, so build unit shapes once
+# and scale copies of their triangles per request
+@lru_cache(maxsize=4)
+def _unit_icosphere_triangles(subdivisions: int) -> np.ndarray:
+    triangles = trimesh.creation.icosphere(subdivisions=subdivisions, radius=1.0).triangles
+    triangles = triangles.astype(np.float32)
+    triangles.flags.writeable = False
+    return triangles
+
+@lru_cache(maxsize=8)
+def _unit_cylinder_triangles(segments: int) -> np.ndarray:
+    triangles = trimesh.creation.cylinder(radius=1.0, height=1.0, sections=segments).triangles
+    triangles = triangles.astype(np.float32)
+    triangles.flags.writeable = False
+    return triangles
+
 class FileManager:
     """Utility class for managing generated files and directories"""
 
@@ -21,9 +61,11 @@ class FileManager:
         self.base_dir.mkdir(exist_ok=True)
 
         # Create subdirectories
-        (self.base_dir / "models").mkdir(exist_ok=True)
-        (self.base_dir / "thumbnails").mkdir(exist_ok=True)
-        (self.base_dir / "temp").mkdir(exist_ok=True)
+        self.models_dir = self.base_dir / "models"
+        self.thumbnails_dir = self.base_dir / "thumbnails"
+        self.temp_dir = self.base_dir / "temp"
+        for directory in (self.models_dir, self.thumbnails_dir, self.temp_dir):
+            directory.mkdir(exist_ok=True)
 
     def generate_unique_filename(self, extension: str = "stl") -> str:
         """Generate a unique filename with timestamp and UUID"""
@@ -34,25 +76,26 @@ class FileManager:
 
     def get_model_path(self, filename: str) -> Path:
         """Get full path for a model file"""
-        return self.base_dir / "models" / filename
+        return self.models_dir / filename
 
     def get_thumbnail_path(self, filename: str) -> Path:
         """Get full path for a thumbnail file"""
-        return self.base_dir / "thumbnails" / filename
+        return self.thumbnails_dir / filename
 
     def cleanup_temp_files(self, older_than_hours: int = 24):
         """Clean up temporary files older than specified hours"""
         import time
         cutoff_time = time.time() - (older_than_hours * 3600)
-        temp_dir = self.base_dir / "temp"
-
-        for file_path in temp_dir.glob("*"):
-            if file_path.stat().st_mtime < cutoff_time:
+        with os.scandir(self.temp_dir) as entries:
+            for entry in entries:
                 try:
-                    file_path.unlink()
-                    logger.info(f"Cleaned up temp file: {file_path}")
+                    if not entry.is_file(follow_symlinks=False):
+                        continue
+                    if entry.stat(follow_symlinks=False).st_mtime < cutoff_time:
+                        os.unlink(entry.path)
+                        logger.info(f"Cleaned up temp file: {entry.path}")
                 except Exception as e:
-                    logger.error(f"Failed to cleanup {file_path}: {e}")
+                    logger.error(f"Failed to cleanup {entry.path}: {e}")
 
 class MeshProcessor:
     """Utility class for 3D mesh processing operations"""
@@ -72,21 +115,24 @@ class MeshProcessor:
             [2, 6, 7], [2, 7, 3],  # back
             [0, 3, 7], [0, 7, 4],  # left
             [1, 5, 6], [1, 6, 2]   # right
-        ])
+        ], dtype=np.int32)
 
-        cube_mesh = mesh.Mesh(np.zeros(faces.shape[0], dtype=mesh.Mesh.dtype))
-        for i, face in enumerate(faces):
-            for j in range(3):
-                cube_mesh.vectors[i][j] = vertices[face[j]]
+        return MeshProcessor._mesh_from_triangles(vertices[faces])
 
-        return cube_mesh
+    @staticmethod
+    def _mesh_from_triangles(triangles: np.ndarray) -> mesh.Mesh:
+        """Wrap an (F, 3, 3) triangle array in an STL mesh"""
+        # Fill every field before wrapping so numpy-stl computes real normals
+        data = np.empty(len(triangles), dtype=mesh.Mesh.dtype)
+        data["vectors"] = triangles
+        data["attr"] = 0
+        return mesh.Mesh(data)
 
     @staticmethod
     def create_sphere(radius: float = 1.0, resolution: int = 20) -> mesh.Mesh:
         """Create a sphere mesh using trimesh"""
         try:
-            sphere = trimesh.creation.icosphere(subdivisions=2, radius=radius)
-            return mesh.Mesh(sphere.triangles)
+            return MeshProcessor._mesh_from_triangles(_unit_icosphere_triangles(2) * radius)
         except Exception as e:
             logger.error(f"Failed to create sphere: {e}")
             # Fallback to cube if sphere creation fails
@@ -96,8 +142,8 @@ class MeshProcessor:
     def create_cylinder(radius: float = 1.0, height: float = 2.0, segments: int = 20) -> mesh.Mesh:
         """Create a cylinder mesh"""
         try:
-            cylinder = trimesh.creation.cylinder(radius=radius, height=height, sections=segments)
-            return mesh.Mesh(cylinder.triangles)
+            scale = np.array([radius, radius, height], dtype=np.float32)
+            return MeshProcessor._mesh_from_triangles(_unit_cylinder_triangles(segments) * scale)
         except Exception as e:
             logger.error(f"Failed to create cylinder: {e}")
             return MeshProcessor.create_cube(size=radius * 2)
@@ -114,16 +160,19 @@ class MeshProcessor:
         }
 
         try:
-            # Convert to trimesh for analysis
-            tm = trimesh.Trimesh(vertices=mesh_obj.vectors.reshape(-1, 3)[::3],
-                               faces=np.arange(len(mesh_obj.vectors)).reshape(-1, 3))
-
-            validation_result["is_manifold"] = tm.is_manifold
+            # Convert to trimesh for analysis; process=True merges the
+            # per-triangle duplicate vertices so topology checks are meaningful
+            triangle_count = len(mesh_obj.vectors)
+            tm = trimesh.Trimesh(vertices=mesh_obj.vectors.reshape(-1, 3),
+                                 faces=np.arange(triangle_count * 3, dtype=np.int32).reshape(-1, 3),
+                                 process=True)
+
+            validation_result["is_manifold"] = is_edge_manifold(tm)
             validation_result["is_watertight"] = tm.is_watertight
             validation_result["volume"] = float(tm.volume) if tm.is_watertight else 0.0
             validation_result["surface_area"] = float(tm.area)
 
-            if not tm.is_manifold:
+            if not validation_result["is_manifold"]:
                 validation_result["errors"].append("Mesh is not manifold")
             if not tm.is_watertight:
                 validation_result["errors"].append("Mesh is not watertight")
@@ -139,11 +188,11 @@ class MeshProcessor:
         """Optimize mesh for 3D printing (placeholder implementation)"""
         try:
             # Load mesh
-            original_mesh = mesh.Mesh.from_file(input_path)
+            original_mesh = load_stl_fast(input_path)
 
             # For now, just copy the mesh (mesh optimization would require more advanced libraries)
             # In a full implementation, you would use libraries like PyMeshLab or Open3D
-            original_mesh.save(output_path)
+            CoreMeshProcessor.save_binary_stl(original_mesh, output_path)
 
             logger.info(f"Mesh optimization completed: {input_path} -> {output_path}")
             return True
@@ -152,6 +201,17 @@ class MeshProcessor:
             logger.error(f"Mesh optimization failed: {e}")
             return False
 
+# Shape-hint keyword groups in priority order, matched like the demo model's
+_HINT_SHAPE_LOOKUP = _compile_keywords([
+    ("sphere", ["sphere", "ball", "round"]),
+    ("cylinder", ["cylinder", "tube", "pipe"]),
+    ("cube", ["cube", "box", "square"])
+])
+_HINT_SIZE_LOOKUP = _compile_keywords([
+    (0.5, ["small", "tiny", "mini"]),
+    (2.0, ["large", "big", "huge"])
+])
+
 class PromptProcessor:
     """Utility class for processing and analyzing text prompts"""
 
@@ -175,31 +235,54 @@ class PromptProcessor:
         prompt_lower = prompt.lower()
 
         # Simple keyword matching for demo purposes
-        shape_hints = {
-            "primary_shape": "cube",  # default
-            "size": 1.0,
+        return {
+            "primary_shape": _lookup_keyword(prompt_lower, _HINT_SHAPE_LOOKUP, "cube"),
+            "size": _lookup_keyword(prompt_lower, _HINT_SIZE_LOOKUP, 1.0),
             "color": "default"
         }
 
-        if any(word in prompt_lower for word in ["sphere", "ball", "round"]):
-            shape_hints["primary_shape"] = "sphere"
-        elif any(word in prompt_lower for word in ["cylinder", "tube", "pipe"]):
-            shape_hints["primary_shape"] = "cylinder"
-        elif any(word in prompt_lower for word in ["cube", "box", "square"]):
-            shape_hints["primary_shape"] = "cube"
+    @staticmethod
+    def generate_hash(prompt: str) -> str:
+        """Generate a hash for prompt-based caching"""
+        return hashlib.blake2b(prompt.encode(), digest_size=16).hexdigest()
 
-        # Extract size hints
-        if any(word in prompt_lower for word in ["small", "tiny", "mini"]):
-            shape_hints["size"] = 0.5
-        elif any(word in prompt_lower for word in ["large", "big", "huge"]):
-            shape_hints["size"] = 2.0
+class ModelCache:
+    """LRU cache mapping generation parameters to previously generated files"""
 
-        return shape_hints
+    def __init__(self, max_entries: int = 1024):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, str]" = OrderedDict()
 
     @staticmethod
-    def generate_hash(prompt: str) -> str:
-        """Generate a hash for prompt-based caching"""
-        return hashlib.md5(prompt.encode()).hexdigest()
+    def make_key(prompt: str, model_type: str = "demo", format: str = "stl") -> str:
+        """Build a cache key from the parameters that determine the output"""
+        return PromptProcessor.generate_hash(f"{model_type}|{format}|{prompt}")
+
+    def get(self, key: str) -> Optional[str]:
+        """Get the cached file path, dropping entries whose file was removed"""
+        file_path = self._entries.get(key)
+        if file_path is None:
+            return None
+        if not os.path.exists(file_path):
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return file_path
+
+    def put(self, key: str, file_path: str):
+        """Cache a generated file path, evicting the least recently used entry"""
+        self._entries[key] = file_path
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    @staticmethod
+    def link_or_copy(source: str, destination: str):
+        """Hardlink a cached file to a new name, copying if linking isn't possible"""
+        try:
+            os.link(source, destination)
+        except OSError:
+            shutil.copyfile(source, destination)
 
 class AsyncJobManager:
     """Utility class for managing asynchronous generation jobs"""
@@ -237,13 +320,27 @@ class AsyncJobManager:
         """Get the length of the job queue"""
         return len(self.job_queue)
 
+# Cache model type for create_demo_model's primitives, which differ from what
+# the core demo model generates for the same prompt
+PRIMITIVE_CACHE_MODEL_TYPE = "api-primitives"
+
 # Global instances
 file_manager = FileManager()
 job_manager = AsyncJobManager()
+model_cache = ModelCache()
 
 def create_demo_model(prompt: str, job_id: str) -> str:
     """Create a demo 3D model based on prompt analysis"""
     try:
+        # Identical prompts produce identical meshes, reuse a previous file
+        cache_key = ModelCache.make_key(prompt, PRIMITIVE_CACHE_MODEL_TYPE)
+        cached_path = model_cache.get(cache_key)
+        if cached_path:
+            output_path = file_manager.get_model_path(file_manager.generate_unique_filename("stl"))
+            ModelCache.link_or_copy(cached_path, str(output_path))
+            logger.info(f"Reused cached demo model for prompt '{prompt}': {output_path}")
+            return str(output_path)
+
         # Process prompt to determine shape
         shape_hints = PromptProcessor.extract_shape_hints(prompt)
 
@@ -258,7 +355,8 @@ def create_demo_model(prompt: str, job_id: str) -> str:
         # Save model
         filename = file_manager.generate_unique_filename("stl")
         output_path = file_manager.get_model_path(filename)
-        model_mesh.save(str(output_path))
+        CoreMeshProcessor.save_binary_stl(model_mesh, str(output_path))
+        model_cache.put(cache_key, str(output_path))
 
         logger.info(f"Created demo model for prompt '{prompt}': {output_path}")
         return str(output_path)
@@ -290,11 +388,12 @@ def get_disk_usage() -> Dict[str, float]:
         logger.error(f"Failed to get disk usage: {e}")
         return {"total_gb": 0, "used_gb": 0, "free_gb": 0}
 
+MODEL_FILE_EXTENSIONS = frozenset({".stl", ".obj"})
+
 def count_generated_models() -> int:
     """Count the number of generated model files"""
     try:
-        models_dir = file_manager.base_dir / "models"
-        return len(list(models_dir.glob("*.stl"))) + len(list(models_dir.glob("*.obj")))
+        return sum(1 for path in file_manager.models_dir.iterdir() if path.suffix in MODEL_FILE_EXTENSIONS)
     except Exception as e:
         logger.error(f"Failed to count models: {e}")
         return 0
\ No newline at end of file
@@ -0,0 +1,118 @@
+"""Numba kernels for per-face mesh computations on very large meshes
+
+These loop over faces directly instead of materializing (N, 3, 3) triangle
+temporaries like the NumPy paths in mesh_utils do. Numba is optional; check
+NUMBA_AVAILABLE before calling anything here.
+"""
+import math
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# Below this many faces the NumPy paths are as fast and skip JIT warm-up
+NUMBA_MIN_FACES = 200_000
+
+
+def use_kernels(array) -> bool:
+    """Whether a face/vertex array is large enough to be worth routing through Numba"""
+    return NUMBA_AVAILABLE and len(array) >= NUMBA_MIN_FACES
+
+
+if NUMBA_AVAILABLE:
+
+    @njit(parallel=True, fastmath=True, cache=True)
+    def surface_area(vertices, faces):
+        """Sum of triangle areas"""
+        total = 0.0
+        for i in prange(faces.shape[0]):
+            a, b, c = faces[i, 0], faces[i, 1], faces[i, 2]
+            e1x = vertices[b, 0] - vertices[a, 0]
+            e1y = vertices[b, 1] - vertices[a, 1]
+            e1z = vertices[b, 2] - vertices[a, 2]
+            e2x = vertices[c, 0] - vertices[a, 0]
+            e2y = vertices[c, 1] - vertices[a, 1]
+            e2z = vertices[c, 2] - vertices[a, 2]
+            cx = e1y * e2z - e1z * e2y
+            cy = e1z * e2x - e1x * e2z
+            cz = e1x * e2y - e1y * e2x
+            total += 0.5 * math.sqrt(cx * cx + cy * cy + cz * cz)
+        return total
+
+    @njit(parallel=True, fastmath=True, cache=True)
+    def signed_volume(vertices, faces):
+        """Sum of signed tetrahedron volumes from the origin"""
+        total = 0.0
+        for i in prange(faces.shape[0]):
+            a, b, c = faces[i, 0], faces[i, 1], faces[i, 2]
+            cx = vertices[b, 1] * vertices[c, 2] - vertices[b, 2] * vertices[c, 1]
+            cy = vertices[b, 2] * vertices[c, 0] - vertices[b, 0] * vertices[c, 2]
+            cz = vertices[b, 0] * vertices[c, 1] - vertices[b, 1] * vertices[c, 0]
+            total += vertices[a, 0] * cx + vertices[a, 1] * cy + vertices[a, 2] * cz
+        return total / 6.0
+
+    @njit(parallel=True, fastmath=True, cache=True)
+    def bounds(vertices):
+        """Per-axis minimum and maximum in one fused pass (needs at least one vertex)"""
+        # Seed from a real vertex: fastmath assumes no infinities, so starting
+        # the accumulators at +/-inf would be undefined
+        min_x = max_x = vertices[0, 0]
+        min_y = max_y = vertices[0, 1]
+        min_z = max_z = vertices[0, 2]
+        for i in prange(vertices.shape[0]):
+            x, y, z = vertices[i, 0], vertices[i, 1], vertices[i, 2]
+            min_x = min(min_x, x)
+            min_y = min(min_y, y)
+            min_z = min(min_z, z)
+            max_x = max(max_x, x)
+            max_y = max(max_y, y)
+            max_z = max(max_z, z)
+
+        min_coords = np.empty(3, dtype=vertices.dtype)
+        max_coords = np.empty(3, dtype=vertices.dtype)
+        min_coords[0], min_coords[1], min_coords[2] = min_x, min_y, min_z
+        max_coords[0], max_coords[1], max_coords[2] = max_x, max_y, max_z
+        return min_coords, max_coords
+
+    @njit(parallel=True, fastmath=True, cache=True)
+    def degenerate_face_count(vertices, faces, min_area_squared):
+        """Number of faces with repeated indices or non-positive area"""
+        count = 0
+        for i in prange(faces.shape[0]):
+            a, b, c = faces[i, 0], faces[i, 1], faces[i, 2]
+            if a == b or b == c or a == c:
+                count += 1
+                continue
+            e1x = vertices[b, 0] - vertices[a, 0]
+            e1y = vertices[b, 1] - vertices[a, 1]
+            e1z = vertices[b, 2] - vertices[a, 2]
+            e2x = vertices[c, 0] - vertices[a, 0]
+            e2y = vertices[c, 1] - vertices[a, 1]
+            e2z = vertices[c, 2] - vertices[a, 2]
+            cx = e1y * e2z - e1z * e2y
+            cy = e1z * e2x - e1x * e2z
+            cz = e1x * e2y - e1y * e2x
+            if cx * cx + cy * cy + cz * cz <= min_area_squared:
+                count += 1
+        return count
+
+    @njit(parallel=True, fastmath=True, cache=True)
+    def center_into(vertices, out):
+        """Write vertices minus their centroid to out (sum and subtract in two passes)"""
+        n = vertices.shape[0]
+        sum_x = sum_y = sum_z = 0.0
+        for i in prange(n):
+            sum_x += vertices[i, 0]
+            sum_y += vertices[i, 1]
+            sum_z += vertices[i, 2]
+
+        cx, cy, cz = sum_x / n, sum_y / n, sum_z / n
+        for i in prange(n):
+            out[i, 0] = vertices[i, 0] - cx
+            out[i, 1] = vertices[i, 1] - cy
+            out[i, 2] = vertices[i, 2] - cz
+        return out
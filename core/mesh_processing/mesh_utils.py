@@ -1,51 +1,199 @@
 import numpy as np
-from typing import Tuple, Dict, Any, Optional
+from typing import Tuple, Dict, Any, List, Optional
 import logging
+from collections import namedtuple
 from pathlib import Path
 from stl import mesh
 import trimesh
 
+from . import _kernels
+
 logger = logging.getLogger(__name__)
 
+# Buffer size for STL writes, so the whole mesh goes out in few syscalls
+STL_WRITE_BUFFER_SIZE = 1024 * 1024
+
+# Binary STL: 80-byte header, uint32 triangle count, then packed 50-byte records
+STL_HEADER = b"Binary STL written by ai-3d-generator".ljust(80, b" ")
+STL_RECORD_DTYPE = np.dtype([
+    ("normal", "<f4", (3,)),
+    ("vectors", "<f4", (3, 3)),
+    ("attr", "<u2")
+])
+
+# Faces whose squared edge cross product (4 * area^2) is at most this are degenerate
+DEGENERATE_AREA_SQUARED = 1e-20
+
+# Face index dtype; 32-bit indices halve index bandwidth versus NumPy's int64 default
+FACE_DTYPE = np.int32
+_FACE_DTYPES = (np.dtype(np.int32), np.dtype(np.uint32))
+
+def as_face_array(faces) -> np.ndarray:
+    """Return faces as a C-contiguous 32-bit index array, copying only if needed
+
+    Raises ValueError instead of casting non-integer or out-of-range indices,
+    which would otherwise silently wrap to different (valid looking) indices.
+    """
+    faces = np.asarray(faces)
+    if faces.dtype in _FACE_DTYPES and faces.flags.c_contiguous:
+        return faces
+
+    if faces.size:
+        if faces.dtype.kind not in "iu":
+            raise ValueError(f"Face indices must be integers, got {faces.dtype}")
+        limits = np.iinfo(FACE_DTYPE)
+        if faces.min() < limits.min or faces.max() > limits.max:
+            raise ValueError("Face indices don't fit in 32 bits")
+    return np.ascontiguousarray(faces, dtype=FACE_DTYPE)
+
+def _prep(vertices, faces) -> Tuple[np.ndarray, np.ndarray]:
+    """Coerce mesh arrays to contiguous float32 vertices and 32-bit faces
+
+    Matches STL's own float32 storage. Arrays already in that layout pass
+    through untouched, so callers should pre-convert to avoid a copy per call.
+    """
+    return np.ascontiguousarray(vertices, dtype=np.float32), as_face_array(faces)
+
+# Structure-of-arrays vertex layout: one contiguous array per axis, so
+# per-axis reductions stream memory instead of striding across (N, 3) rows
+VerticesSoA = namedtuple("VerticesSoA", "x y z")
+
+def _use_vertex_kernels(vertices: np.ndarray) -> bool:
+    """Whether an (N, 3) vertex array should go through the Numba kernels"""
+    return _kernels.use_kernels(vertices) and vertices.ndim == 2 and vertices.shape[1] == 3
+
+def _bounds(vertices: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Per-axis (min, max) of vertices, fused into one pass for large meshes"""
+    if _use_vertex_kernels(vertices):
+        return _kernels.bounds(vertices)
+    return vertices.min(axis=0), vertices.max(axis=0)
+
+def _max_extent(vertices) -> float:
+    """Largest bounding box side, from one (fused, for large meshes) min/max pass"""
+    if isinstance(vertices, VerticesSoA):
+        return float(max(np.ptp(axis) for axis in vertices))
+    min_coords, max_coords = _bounds(vertices)
+    return float((max_coords - min_coords).max())
+
+def _corners(vertices: np.ndarray, faces: np.ndarray,
+             triangles: Optional[np.ndarray] = None) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Per-face corner arrays, as views into triangles if already gathered"""
+    if triangles is not None:
+        return triangles[:, 0], triangles[:, 1], triangles[:, 2]
+    return vertices[faces[:, 0]], vertices[faces[:, 1]], vertices[faces[:, 2]]
+
+def is_edge_manifold(tm: trimesh.Trimesh) -> bool:
+    """Whether no edge of the mesh is shared by more than two faces
+
+    trimesh has no is_manifold property; is_watertight covers the stricter
+    "every edge has exactly two faces" case.
+    """
+    if len(tm.faces) == 0:
+        return True
+    return bool(np.bincount(tm.edges_unique_inverse).max() <= 2)
+
+def _copy_into(out: np.ndarray, values: np.ndarray) -> np.ndarray:
+    """Copy values into out and return it"""
+    np.copyto(out, values)
+    return out
+
 class MeshProcessor:
     """Advanced mesh processing utilities for 3D models"""
 
+    VerticesSoA = VerticesSoA
+
+    @staticmethod
+    def to_soa(vertices: np.ndarray) -> VerticesSoA:
+        """Convert (N, 3) vertices to per-axis contiguous arrays (one allocation)"""
+        return VerticesSoA(*np.array(np.asarray(vertices).T, order="C"))
+
+    @staticmethod
+    def as_aos(soa: VerticesSoA) -> np.ndarray:
+        """Convert per-axis arrays back to (N, 3) vertices, e.g. for STL export"""
+        return np.stack(soa, axis=1)
+
+    @staticmethod
+    def prepare_triangles(vertices: np.ndarray, faces: np.ndarray) -> np.ndarray:
+        """Gather (F, 3, 3) triangle corners once, for reuse by validate_mesh and create_mesh_from_arrays"""
+        vertices, faces = _prep(vertices, faces)
+        return vertices[faces]
+
     @staticmethod
-    def create_mesh_from_arrays(vertices: np.ndarray, faces: np.ndarray) -> mesh.Mesh:
-        """Create STL mesh from vertex and face arrays"""
+    def create_mesh_from_arrays(vertices: np.ndarray, faces: np.ndarray,
+                                triangles: Optional[np.ndarray] = None) -> mesh.Mesh:
+        """Create STL mesh from vertex and face arrays (or already gathered triangles)"""
         try:
+            vertices, faces = _prep(vertices, faces)
+
             # Validate input
             if vertices.shape[1] != 3:
                 raise ValueError(f"Vertices must have shape (N, 3), got {vertices.shape}")
             if faces.shape[1] != 3:
                 raise ValueError(f"Faces must have shape (N, 3), got {faces.shape}")
 
-            # Create mesh
-            stl_mesh = mesh.Mesh(np.zeros(faces.shape[0], dtype=mesh.Mesh.dtype))
-
-            for i, face in enumerate(faces):
-                for j in range(3):
-                    stl_mesh.vectors[i][j] = vertices[face[j]]
+            # Fill the record array before wrapping it so numpy-stl computes real normals;
+            # every field is written, so skip the zero fill
+            data = np.empty(faces.shape[0], dtype=mesh.Mesh.dtype)
+            data["vectors"] = vertices[faces] if triangles is None else triangles
+            data["attr"] = 0
 
-            return stl_mesh
+            return mesh.Mesh(data)
 
         except Exception as e:
             logger.error(f"Failed to create mesh: {e}")
             raise
 
     @staticmethod
-    def save_mesh(mesh_obj: mesh.Mesh, file_path: str, format: str = "stl") -> bool:
-        """Save mesh to file in specified format"""
+    def create_meshes_batch(pairs: List[Tuple[np.ndarray, np.ndarray]]) -> List[mesh.Mesh]:
+        """Create STL meshes for several (vertices, faces) pairs from one shared buffer"""
+        try:
+            pairs = [_prep(vertices, faces) for vertices, faces in pairs]
+            for vertices, faces in pairs:
+                if vertices.shape[1] != 3 or faces.shape[1] != 3:
+                    raise ValueError(f"Expected (N, 3) vertices and faces, got {vertices.shape} and {faces.shape}")
+
+            # One allocation for every mesh; each Mesh wraps a slice of it
+            data = np.empty(sum(len(faces) for _, faces in pairs), dtype=mesh.Mesh.dtype)
+            data["attr"] = 0
+            meshes = []
+            offset = 0
+            for vertices, faces in pairs:
+                chunk = data[offset:offset + len(faces)]
+                chunk["vectors"] = vertices[faces]
+                meshes.append(mesh.Mesh(chunk, remove_empty_areas=False))
+                offset += len(faces)
+
+            return meshes
+
+        except Exception as e:
+            logger.error(f"Failed to create meshes: {e}")
+            raise
+
+    @staticmethod
+    def save_mesh(mesh_obj: Optional[mesh.Mesh], file_path: str, format: str = "stl",
+                  vertices: Optional[np.ndarray] = None, faces: Optional[np.ndarray] = None) -> bool:
+        """Save mesh to file in specified format
+
+        When the source vertex/face arrays are passed, non-STL formats are
+        exported from them directly instead of being recovered from the STL.
+        """
         try:
             file_path = Path(file_path)
             file_path.parent.mkdir(parents=True, exist_ok=True)
+            has_arrays = vertices is not None and faces is not None
 
             if format.lower() == "stl":
-                mesh_obj.save(str(file_path))
+                if has_arrays:
+                    MeshProcessor.write_stl(vertices, faces, file_path)
+                else:
+                    MeshProcessor.save_binary_stl(mesh_obj, file_path)
                 return True
             elif format.lower() in ["obj", "ply"]:
                 # Convert to trimesh for other formats
-                tm = MeshProcessor._stl_to_trimesh(mesh_obj)
+                if has_arrays:
+                    tm = trimesh.Trimesh(vertices=vertices, faces=faces, process=False)
+                else:
+                    tm = MeshProcessor._stl_to_trimesh(mesh_obj)
                 tm.export(str(file_path))
                 return True
             else:
@@ -55,32 +203,79 @@ class MeshProcessor:
             logger.error(f"Failed to save mesh: {e}")
             return False
 
+    @staticmethod
+    def save_binary_stl(mesh_obj: mesh.Mesh, file_path: str):
+        """Write an STL mesh as binary STL"""
+        MeshProcessor.write_stl_triangles(mesh_obj.vectors, file_path)
+
+    @staticmethod
+    def write_stl(vertices: np.ndarray, faces: np.ndarray, file_path: str, ascii: bool = False):
+        """Write vertex/face arrays as an STL file"""
+        vertices, faces = _prep(vertices, faces)
+        MeshProcessor.write_stl_triangles(vertices[faces.astype(np.intp, copy=False)], file_path, ascii=ascii)
+
+    @staticmethod
+    def write_stl_triangles(triangles: np.ndarray, file_path: str, ascii: bool = False):
+        """Write an (N, 3, 3) triangle array as an STL file
+
+        Binary output packs all records into one structured array and writes
+        it with a single call, bypassing numpy-stl's Python save path.
+        """
+        triangles = np.asarray(triangles, dtype=np.float32)
+
+        # Unit face normals, left as zero for degenerate triangles
+        normals = np.cross(triangles[:, 1] - triangles[:, 0], triangles[:, 2] - triangles[:, 0])
+        lengths = np.linalg.norm(normals, axis=1, keepdims=True)
+        np.divide(normals, lengths, out=normals, where=lengths > 0)
+
+        if ascii:
+            with open(file_path, "w", buffering=STL_WRITE_BUFFER_SIZE) as fh:
+                fh.write("solid mesh\n")
+                for normal, (v0, v1, v2) in zip(normals, triangles):
+                    fh.write(
+                        f"facet normal {normal[0]:e} {normal[1]:e} {normal[2]:e}\n"
+                        "  outer loop\n"
+                        f"    vertex {v0[0]:e} {v0[1]:e} {v0[2]:e}\n"
+                        f"    vertex {v1[0]:e} {v1[1]:e} {v1[2]:e}\n"
+                        f"    vertex {v2[0]:e} {v2[1]:e} {v2[2]:e}\n"
+                        "  endloop\n"
+                        "endfacet\n"
+                    )
+                fh.write("endsolid mesh\n")
+            return
+
+        # Every field is written below, so skip the zero fill
+        records = np.empty(len(triangles), dtype=STL_RECORD_DTYPE)
+        records["normal"] = normals
+        records["vectors"] = triangles
+        records["attr"] = 0
+
+        with open(file_path, "wb", buffering=STL_WRITE_BUFFER_SIZE) as fh:
+            fh.write(STL_HEADER)
+            fh.write(np.uint32(len(records)).tobytes())
+            fh.write(records.data)
+
     @staticmethod
     def _stl_to_trimesh(stl_mesh: mesh.Mesh) -> trimesh.Trimesh:
         """Convert STL mesh to trimesh"""
-        vertices = []
-        faces = []
-
-        # Extract unique vertices and build face indices
-        vertex_map = {}
-        vertex_index = 0
-
-        for triangle in stl_mesh.vectors:
-            face = []
-            for vertex in triangle:
-                vertex_tuple = tuple(vertex)
-                if vertex_tuple not in vertex_map:
-                    vertex_map[vertex_tuple] = vertex_index
-                    vertices.append(vertex)
-                    vertex_index += 1
-                face.append(vertex_map[vertex_tuple])
-            faces.append(face)
-
-        return trimesh.Trimesh(vertices=np.array(vertices), faces=np.array(faces))
+        # Deduplicate the per-triangle corners and index faces into the unique set
+        flat_vertices = stl_mesh.vectors.reshape(-1, 3)
+        vertices, inverse = np.unique(flat_vertices, axis=0, return_inverse=True)
+        faces = inverse.reshape(-1, 3).astype(FACE_DTYPE)
+
+        # Vertices are already merged above, skip trimesh's own processing pass
+        return trimesh.Trimesh(vertices=vertices, faces=faces, process=False)
 
     @staticmethod
-    def validate_mesh(vertices: np.ndarray, faces: np.ndarray) -> Dict[str, Any]:
-        """Validate mesh geometry and return analysis"""
+    def validate_mesh(vertices: np.ndarray, faces: np.ndarray, trusted: bool = False, deep: bool = False,
+                      triangles: Optional[np.ndarray] = None) -> Dict[str, Any]:
+        """Validate mesh geometry and return analysis
+
+        Pass trusted=True for meshes that are valid by construction (e.g. demo
+        primitives) to skip the geometric checks and only report counts.
+        Pass deep=True to also run the trimesh manifold/watertight analysis.
+        Pass triangles from prepare_triangles() to reuse an existing gather.
+        """
         validation = {
             "is_valid": True,
             "errors": [],
@@ -88,7 +283,17 @@ class MeshProcessor:
             "stats": {}
         }
 
+        if trusted:
+            validation["stats"] = {
+                "vertex_count": len(vertices),
+                "face_count": len(faces)
+            }
+            return validation
+
         try:
+            vertices = np.asarray(vertices)
+            faces = np.asarray(faces)
+
             # Basic shape validation
             if vertices.ndim != 2 or vertices.shape[1] != 3:
                 validation["errors"].append(f"Invalid vertex shape: {vertices.shape}")
@@ -106,39 +311,64 @@ class MeshProcessor:
                 validation["errors"].append("No faces found")
                 validation["is_valid"] = False
 
-            # Face index validation
-            max_vertex_index = len(vertices) - 1
-            if np.any(faces > max_vertex_index):
-                validation["errors"].append("Face indices exceed vertex count")
+            # Face index validation, on the caller's dtype so nothing is narrowed yet
+            if faces.size and faces.dtype.kind not in "iu":
+                validation["errors"].append(f"Face indices must be integers, got {faces.dtype}")
                 validation["is_valid"] = False
+            elif faces.size:
+                if faces.max() > len(vertices) - 1:
+                    validation["errors"].append("Face indices exceed vertex count")
+                    validation["is_valid"] = False
 
-            if np.any(faces < 0):
-                validation["errors"].append("Negative face indices found")
-                validation["is_valid"] = False
+                if faces.min() < 0:
+                    validation["errors"].append("Negative face indices found")
+                    validation["is_valid"] = False
+
+            # Indices are now known to be in range, so narrowing to 32 bits is lossless
+            if validation["is_valid"]:
+                vertices, faces = _prep(vertices, faces)
+
+            # Gather triangles once for area, volume and degeneracy (large meshes use the kernels)
+            if triangles is None and validation["is_valid"] and not _kernels.use_kernels(faces):
+                triangles = vertices[faces]
+
+            # Geometry of a mesh with bad indices is meaningless, so skip it
+            surface_area = volume = 0.0
+            if validation["is_valid"]:
+                surface_area = MeshProcessor._estimate_surface_area(vertices, faces, triangles)
+                volume = MeshProcessor._estimate_volume(vertices, faces, triangles)
 
             # Calculate statistics
             validation["stats"] = {
                 "vertex_count": len(vertices),
                 "face_count": len(faces),
                 "bounding_box": MeshProcessor._calculate_bounding_box(vertices),
-                "surface_area": MeshProcessor._estimate_surface_area(vertices, faces),
-                "volume": MeshProcessor._estimate_volume(vertices, faces)
+                "surface_area": surface_area,
+                "volume": volume
             }
 
-            # Advanced validation using trimesh if possible
-            try:
-                tm = trimesh.Trimesh(vertices=vertices, faces=faces)
-                validation["stats"]["is_manifold"] = tm.is_manifold
-                validation["stats"]["is_watertight"] = tm.is_watertight
+            # Degenerate faces (repeated corners or zero area) are legal but worth flagging
+            if validation["is_valid"]:
+                degenerate = MeshProcessor._count_degenerate_faces(vertices, faces, triangles)
+                validation["stats"]["degenerate_faces"] = degenerate
+                if degenerate:
+                    validation["warnings"].append(f"Mesh has {degenerate} degenerate faces")
+
+            # Advanced validation using trimesh (rebuilds adjacency, so opt-in)
+            if deep:
+                try:
+                    tm = trimesh.Trimesh(vertices=vertices, faces=faces)
+                    validation["stats"]["is_manifold"] = is_edge_manifold(tm)
+                    validation["stats"]["is_watertight"] = tm.is_watertight
 
-                if not tm.is_manifold:
-                    validation["warnings"].append("Mesh is not manifold")
+                    if not validation["stats"]["is_manifold"]:
+                        validation["warnings"].append("Mesh is not manifold")
 
-                if not tm.is_watertight:
-                    validation["warnings"].append("Mesh is not watertight")
+                    if not tm.is_watertight:
+                        validation["warnings"].append("Mesh is not watertight")
 
-            except Exception as e:
-                validation["warnings"].append(f"Advanced validation failed: {e}")
+                except Exception as e:
+                    validation["warnings"].append(f"Advanced validation failed: {e}")
 
         except Exception as e:
             validation["errors"].append(f"Validation error: {e}")
@@ -152,8 +382,7 @@ class MeshProcessor:
         if len(vertices) == 0:
             return {"min": [0, 0, 0], "max": [0, 0, 0], "size": [0, 0, 0]}
 
-        min_coords = np.min(vertices, axis=0)
-        max_coords = np.max(vertices, axis=0)
+        min_coords, max_coords = _bounds(vertices)
         size = max_coords - min_coords
 
         return {
@@ -164,20 +393,19 @@ class MeshProcessor:
         }
 
     @staticmethod
-    def _estimate_surface_area(vertices: np.ndarray, faces: np.ndarray) -> float:
+    def _estimate_surface_area(vertices: np.ndarray, faces: np.ndarray,
+                               triangles: Optional[np.ndarray] = None) -> float:
         """Estimate mesh surface area"""
-        total_area = 0.0
-
         try:
-            for face in faces:
-                if len(face) >= 3:
-                    v0, v1, v2 = vertices[face[:3]]
-                    # Area of triangle using cross product
-                    edge1 = v1 - v0
-                    edge2 = v2 - v0
-                    cross = np.cross(edge1, edge2)
-                    area = np.linalg.norm(cross) / 2.0
-                    total_area += area
+            if triangles is None and _kernels.use_kernels(faces):
+                return float(_kernels.surface_area(vertices, faces))
+
+            v0, v1, v2 = _corners(vertices, faces, triangles)
+            # Area of each triangle using cross product of its edges
+            edge1 = v1 - v0
+            edge2 = v2 - v0
+            # Per-face work stays float32, the total accumulates in float64
+            total_area = 0.5 * np.linalg.norm(np.cross(edge1, edge2), axis=1).sum(dtype=np.float64)
 
         except Exception as e:
             logger.warning(f"Surface area calculation failed: {e}")
@@ -186,16 +414,32 @@ class MeshProcessor:
         return float(total_area)
 
     @staticmethod
-    def _estimate_volume(vertices: np.ndarray, faces: np.ndarray) -> float:
-        """Estimate mesh volume using signed tetrahedra"""
-        volume = 0.0
+    def _count_degenerate_faces(vertices: np.ndarray, faces: np.ndarray,
+                                triangles: Optional[np.ndarray] = None) -> int:
+        """Count faces with repeated vertex indices or (near) zero area"""
+        if triangles is None and _kernels.use_kernels(faces):
+            return int(_kernels.degenerate_face_count(vertices, faces, DEGENERATE_AREA_SQUARED))
+
+        repeated = (faces[:, 0] == faces[:, 1]) | (faces[:, 1] == faces[:, 2]) | (faces[:, 0] == faces[:, 2])
+
+        # Compare the squared cross product to skip the sqrt
+        v0, v1, v2 = _corners(vertices, faces, triangles)
+        cross = np.cross(v1 - v0, v2 - v0)
+        zero_area = np.einsum("ij,ij->i", cross, cross) <= DEGENERATE_AREA_SQUARED
 
+        return int(np.count_nonzero(repeated | zero_area))
+
+    @staticmethod
+    def _estimate_volume(vertices: np.ndarray, faces: np.ndarray,
+                         triangles: Optional[np.ndarray] = None) -> float:
+        """Estimate mesh volume using signed tetrahedra"""
         try:
-            for face in faces:
-                if len(face) >= 3:
-                    v0, v1, v2 = vertices[face[:3]]
-                    # Volume of tetrahedron from origin
-                    volume += np.dot(v0, np.cross(v1, v2)) / 6.0
+            if triangles is None and _kernels.use_kernels(faces):
+                return abs(float(_kernels.signed_volume(vertices, faces)))
+
+            # Volume of each tetrahedron from origin
+            v0, v1, v2 = _corners(vertices, faces, triangles)
+            volume = np.einsum("ij,ij->", v0, np.cross(v1, v2), dtype=np.float64) / 6.0
 
         except Exception as e:
             logger.warning(f"Volume calculation failed: {e}")
@@ -205,19 +449,28 @@ class MeshProcessor:
 
     @staticmethod
     def optimize_mesh(vertices: np.ndarray, faces: np.ndarray, target_faces: Optional[int] = None) -> Tuple[np.ndarray, np.ndarray]:
-        """Optimize mesh by simplification or other operations"""
+        """Optimize mesh by quadric error metric decimation down to target_faces
+
+        Uses trimesh's simplify_quadric_decimation, which needs the optional
+        fast-simplification package; without it the mesh is returned as-is.
+        """
         try:
-            # For now, just return the original mesh
-            # In a full implementation, you would use libraries like:
-            # - PyMeshLab for mesh simplification
-            # - Open3D for various mesh operations
-            # - Custom algorithms for optimization
+            if not target_faces or len(faces) <= target_faces:
+                return vertices, faces
+
+            logger.info(f"Mesh optimization requested: {len(faces)} -> {target_faces} faces")
+
+            # Weld duplicate vertices so edge collapses see the real topology
+            tm = trimesh.Trimesh(vertices=vertices, faces=faces, process=True)
+            simplified = tm.simplify_quadric_decimation(face_count=target_faces)
 
-            if target_faces and len(faces) > target_faces:
-                logger.info(f"Mesh optimization requested: {len(faces)} -> {target_faces} faces")
-                # TODO: Implement mesh simplification
-                # For now, just log the request
+            return (
+                np.asarray(simplified.vertices, dtype=vertices.dtype),
+                np.asarray(simplified.faces, dtype=faces.dtype)
+            )
 
+        except ImportError as e:
+            logger.warning(f"Mesh simplification not available: {e}")
             return vertices, faces
 
         except Exception as e:
@@ -226,100 +479,114 @@ class MeshProcessor:
 
     @staticmethod
     def repair_mesh(vertices: np.ndarray, faces: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
-        """Repair common mesh issues"""
-        try:
-            # Remove duplicate vertices
-            vertices, faces = MeshProcessor._remove_duplicate_vertices(vertices, faces)
-
-            # Remove degenerate faces
-            faces = MeshProcessor._remove_degenerate_faces(vertices, faces)
+        """Repair common mesh issues
 
-            return vertices, faces
+        Merges duplicate vertices (to 6 decimal places) and drops faces that
+        are degenerate, duplicated or reference missing vertices.
+        """
+        try:
+            # trimesh can't index out-of-range faces, so drop those up front
+            # (on the caller's dtype, before narrowing to 32 bits)
+            faces = np.asarray(faces)
+            if faces.size:
+                in_range = (faces.min(axis=1) >= 0) & (faces.max(axis=1) < len(vertices))
+                if not in_range.all():
+                    faces = faces[in_range]
+
+            vertices, faces = _prep(vertices, faces)
+
+            # process=False skips trimesh's automatic cleanup; run only the passes we need
+            tm = trimesh.Trimesh(vertices=vertices, faces=faces, process=False)
+            tm.merge_vertices(digits_vertex=6)
+            keep = tm.nondegenerate_faces()
+            if keep.any():
+                tm.update_faces(keep)
+            tm.update_faces(tm.unique_faces())
+
+            return np.asarray(tm.vertices, dtype=np.float32), as_face_array(tm.faces)
 
         except Exception as e:
             logger.error(f"Mesh repair failed: {e}")
             return vertices, faces
 
     @staticmethod
-    def _remove_duplicate_vertices(vertices: np.ndarray, faces: np.ndarray, tolerance: float = 1e-6) -> Tuple[np.ndarray, np.ndarray]:
-        """Remove duplicate vertices and update face indices"""
-        try:
-            unique_vertices = []
-            vertex_mapping = {}
-            new_faces = []
+    def center_mesh(vertices: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """Center mesh at origin
+
+        VerticesSoA input is centered in place; otherwise the result goes to
+        out if given (e.g. a preallocated scratch buffer, or vertices itself to
+        work in place) or a new array.
+        """
+        if isinstance(vertices, VerticesSoA):
+            for axis in vertices:
+                if axis.size:
+                    axis -= axis.mean()
+            return vertices
 
-            for i, vertex in enumerate(vertices):
-                found = False
-                for j, unique_vertex in enumerate(unique_vertices):
-                    if np.allclose(vertex, unique_vertex, atol=tolerance):
-                        vertex_mapping[i] = j
-                        found = True
-                        break
+        if len(vertices) == 0:
+            return vertices if out is None else _copy_into(out, vertices)
 
-                if not found:
-                    vertex_mapping[i] = len(unique_vertices)
-                    unique_vertices.append(vertex)
+        if _use_vertex_kernels(vertices):
+            if out is None:
+                # Same result dtype as the NumPy path (integer input centers to float64)
+                dtype = vertices.dtype if np.issubdtype(vertices.dtype, np.floating) else np.float64
+                out = np.empty(vertices.shape, dtype=dtype)
+            return _kernels.center_into(vertices, out)
 
-            # Update face indices
-            for face in faces:
-                new_face = [vertex_mapping[vertex_idx] for vertex_idx in face]
-                new_faces.append(new_face)
+        center = np.mean(vertices, axis=0)
+        return np.subtract(vertices, center, out=out)
 
-            return np.array(unique_vertices), np.array(new_faces)
+    @staticmethod
+    def scale_mesh(vertices: np.ndarray, scale_factor: float, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """Scale mesh uniformly (see center_mesh for SoA input and out)"""
+        if isinstance(vertices, VerticesSoA):
+            for axis in vertices:
+                axis *= scale_factor
+            return vertices
 
-        except Exception as e:
-            logger.error(f"Duplicate vertex removal failed: {e}")
-            return vertices, faces
+        return np.multiply(vertices, scale_factor, out=out)
 
     @staticmethod
-    def _remove_degenerate_faces(vertices: np.ndarray, faces: np.ndarray) -> np.ndarray:
-        """Remove faces with zero area or invalid indices"""
-        valid_faces = []
-
-        for face in faces:
-            if len(set(face)) == 3:  # All vertices are different
-                try:
-                    v0, v1, v2 = vertices[face[:3]]
-                    edge1 = v1 - v0
-                    edge2 = v2 - v0
-                    cross = np.cross(edge1, edge2)
-                    area = np.linalg.norm(cross)
+    def normalize_mesh_size(vertices: np.ndarray, target_size: float = 2.0,
+                            out: Optional[np.ndarray] = None) -> np.ndarray:
+        """Normalize mesh to fit within a target size (see center_mesh for SoA input and out)"""
+        if isinstance(vertices, VerticesSoA):
+            if vertices.x.size:
+                current_size = _max_extent(vertices)
+                if current_size > 0:
+                    MeshProcessor.scale_mesh(vertices, target_size / current_size)
+            return vertices
 
-                    if area > 1e-10:  # Non-zero area
-                        valid_faces.append(face)
-                except (IndexError, ValueError):
-                    # Skip invalid faces
-                    continue
+        if len(vertices) == 0:
+            return vertices if out is None else _copy_into(out, vertices)
 
-        return np.array(valid_faces) if valid_faces else faces
+        # Largest side of the current bounding box
+        current_size = _max_extent(vertices)
 
-    @staticmethod
-    def center_mesh(vertices: np.ndarray) -> np.ndarray:
-        """Center mesh at origin"""
-        if len(vertices) == 0:
-            return vertices
+        if current_size > 0:
+            return MeshProcessor.scale_mesh(vertices, target_size / current_size, out=out)
 
-        center = np.mean(vertices, axis=0)
-        return vertices - center
+        return vertices if out is None else _copy_into(out, vertices)
 
     @staticmethod
-    def scale_mesh(vertices: np.ndarray, scale_factor: float) -> np.ndarray:
-        """Scale mesh uniformly"""
-        return vertices * scale_factor
+    def transform_mesh(vertices: np.ndarray, center: bool = True, target_size: Optional[float] = None) -> np.ndarray:
+        """Center and/or normalize a mesh in one pass
 
-    @staticmethod
-    def normalize_mesh_size(vertices: np.ndarray, target_size: float = 2.0) -> np.ndarray:
-        """Normalize mesh to fit within a target size"""
+        Equivalent to normalize_mesh_size(center_mesh(vertices), target_size)
+        but writes a single output array instead of one temporary per step.
+        """
         if len(vertices) == 0:
             return vertices
 
-        # Calculate current bounding box
-        min_coords = np.min(vertices, axis=0)
-        max_coords = np.max(vertices, axis=0)
-        current_size = np.max(max_coords - min_coords)
+        offset = np.mean(vertices, axis=0) if center else 0.0
 
-        if current_size > 0:
-            scale_factor = target_size / current_size
-            return vertices * scale_factor
+        scale_factor = 1.0
+        if target_size is not None:
+            # Bounding box size is unaffected by the centering translation
+            current_size = _max_extent(vertices)
+            if current_size > 0:
+                scale_factor = target_size / current_size
 
-        return vertices
\ No newline at end of file
+        out = np.subtract(vertices, offset, out=np.empty_like(vertices))
+        out *= scale_factor
+        return out
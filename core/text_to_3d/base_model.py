@@ -3,9 +3,50 @@ from typing import Dict, Any, Optional, List
 import numpy as np
 from pathlib import Path
 import logging
+import re
 
 logger = logging.getLogger(__name__)
 
+# Basic content filtering (extend as needed); matched as substrings in one pass
+BANNED_WORDS = ["explicit", "inappropriate", "nsfw"]
+_BANNED_PATTERN = re.compile("|".join(map(re.escape, BANNED_WORDS)))
+
+# Demo prompt keywords, in priority order (the first group with any match wins)
+SHAPE_KEYWORDS = [
+    ("sphere", ["sphere", "ball", "round", "orb"]),
+    ("cylinder", ["cylinder", "tube", "pipe", "rod"]),
+    ("pyramid", ["pyramid", "triangle", "cone"])
+]
+SIZE_KEYWORDS = [
+    (0.5, ["small", "tiny", "mini"]),
+    (2.0, ["large", "big", "huge", "giant"])
+]
+
+def _compile_keywords(groups: List[tuple]) -> tuple:
+    """Compile keyword groups into one scanning pattern plus a keyword -> group rank table
+
+    The lookahead makes matches overlap, so every keyword occurrence is seen
+    exactly as the per-word substring checks would see it.
+    """
+    ranks = {word: rank for rank, (_, words) in enumerate(groups) for word in words}
+    pattern = re.compile("(?=(" + "|".join(map(re.escape, ranks)) + "))")
+    return pattern, ranks, [label for label, _ in groups]
+
+def _lookup_keyword(prompt: str, compiled: tuple, default: Any) -> Any:
+    """Label of the highest priority keyword group found in prompt, in one scan"""
+    pattern, ranks, labels = compiled
+    best = None
+    for match in pattern.finditer(prompt):
+        rank = ranks[match.group(1)]
+        if best is None or rank < best:
+            best = rank
+            if best == 0:
+                break
+    return default if best is None else labels[best]
+
+_SHAPE_LOOKUP = _compile_keywords(SHAPE_KEYWORDS)
+_SIZE_LOOKUP = _compile_keywords(SIZE_KEYWORDS)
+
 class BaseText3DModel(ABC):
     """Abstract base class for text-to-3D generation models"""
 
@@ -35,6 +76,10 @@ class BaseText3DModel(ABC):
         """
         pass
 
+    def generate_3d_batch(self, prompts: List[str], **kwargs) -> List[Dict[str, Any]]:
+        """Generate 3D models for several prompts, returning results in prompt order"""
+        return [self.generate_3d(prompt, **kwargs) for prompt in prompts]
+
     @abstractmethod
     def is_available(self) -> bool:
         """Check if the model is available and can be used"""
@@ -42,17 +87,12 @@ class BaseText3DModel(ABC):
 
     def preprocess_prompt(self, prompt: str) -> str:
         """Preprocess the text prompt before generation"""
-        # Basic cleaning
-        cleaned_prompt = prompt.strip().lower()
+        # Basic cleaning and whitespace collapsing (split() also strips)
+        cleaned_prompt = " ".join(prompt.lower().split())
 
-        # Remove excessive whitespace
-        cleaned_prompt = " ".join(cleaned_prompt.split())
-
-        # Basic content filtering (extend as needed)
-        banned_words = ["explicit", "inappropriate", "nsfw"]
-        for word in banned_words:
-            if word in cleaned_prompt:
-                raise ValueError(f"Inappropriate content detected: {word}")
+        match = _BANNED_PATTERN.search(cleaned_prompt)
+        if match:
+            raise ValueError(f"Inappropriate content detected: {match.group(0)}")
 
         return cleaned_prompt
 
@@ -99,14 +139,13 @@ class BaseText3DModel(ABC):
     def _estimate_volume(self, vertices: np.ndarray, faces: np.ndarray) -> float:
         """Estimate mesh volume using signed volume of tetrahedra"""
         try:
-            # Simple volume estimation
-            volume = 0.0
-            for face in faces:
-                if len(face) >= 3:
-                    v0, v1, v2 = vertices[face[:3]]
-                    # Volume of tetrahedron from origin
-                    volume += np.abs(np.dot(v0, np.cross(v1, v2))) / 6.0
-            return float(volume)
+            # Gather each corner separately rather than an (N, 3, 3) triangle copy
+            v0 = vertices[faces[:, 0]]
+            v1 = vertices[faces[:, 1]]
+            v2 = vertices[faces[:, 2]]
+            # Volume of each tetrahedron from origin
+            volumes = np.einsum("ij,ij->i", v0, np.cross(v1, v2))
+            return float(np.abs(volumes).sum() / 6.0)
         except Exception:
             return 0.0
 
@@ -152,161 +191,190 @@ class DemoText3DModel(BaseText3DModel):
             shape_type = self._extract_shape_type(cleaned_prompt)
             size = self._extract_size(cleaned_prompt)
 
-            # Generate geometry based on shape type
-            if shape_type == "sphere":
-                vertices, faces = self._create_sphere(size)
-            elif shape_type == "cylinder":
-                vertices, faces = self._create_cylinder(size)
-            elif shape_type == "pyramid":
-                vertices, faces = self._create_pyramid(size)
-            else:
-                vertices, faces = self._create_cube(size)
+            # Generate geometry by scaling the shape's cached unit template
+            unit_vertices, faces = _UNIT_SHAPES[shape_type]
+            vertices = unit_vertices * size
 
-            result = self.postprocess_geometry(vertices, faces)
-            result["metadata"]["shape_type"] = shape_type
-            result["metadata"]["generation_method"] = "demo"
+            return self._build_result(vertices, faces, shape_type)
 
-            return result
+        except Exception as e:
+            logger.error(f"Demo generation failed: {e}")
+            raise
+
+    def generate_3d_batch(self, prompts: List[str], **kwargs) -> List[Dict[str, Any]]:
+        """Generate shapes for several prompts, scaling each shape's template once per batch"""
+        try:
+            cleaned_prompts = [self.preprocess_prompt(prompt) for prompt in prompts]
+
+            # Group prompt indices by shape so each template is scaled in one op
+            groups: Dict[str, List[int]] = {}
+            for i, cleaned_prompt in enumerate(cleaned_prompts):
+                groups.setdefault(self._extract_shape_type(cleaned_prompt), []).append(i)
+
+            results: List[Optional[Dict[str, Any]]] = [None] * len(prompts)
+            for shape_type, indices in groups.items():
+                unit_vertices, faces = _UNIT_SHAPES[shape_type]
+                sizes = np.array([self._extract_size(cleaned_prompts[i]) for i in indices], dtype=np.float32)
+
+                # (N, V, 3) tensor; each result gets a view into it
+                vertices = unit_vertices[None] * sizes[:, None, None]
+                for k, i in enumerate(indices):
+                    results[i] = self._build_result(vertices[k], faces, shape_type)
+
+            return results
 
         except Exception as e:
             logger.error(f"Demo generation failed: {e}")
             raise
 
+    def _build_result(self, vertices: np.ndarray, faces: np.ndarray, shape_type: str) -> Dict[str, Any]:
+        """Postprocess a primitive and tag its metadata"""
+        result = self.postprocess_geometry(vertices, faces)
+        result["metadata"]["shape_type"] = shape_type
+        result["metadata"]["generation_method"] = "demo"
+        # Primitives are well-formed by construction, no need to re-validate
+        result["metadata"]["trusted"] = True
+        return result
+
     def _extract_shape_type(self, prompt: str) -> str:
         """Extract shape type from prompt"""
-        if any(word in prompt for word in ["sphere", "ball", "round", "orb"]):
-            return "sphere"
-        elif any(word in prompt for word in ["cylinder", "tube", "pipe", "rod"]):
-            return "cylinder"
-        elif any(word in prompt for word in ["pyramid", "triangle", "cone"]):
-            return "pyramid"
-        else:
-            return "cube"
+        return _lookup_keyword(prompt, _SHAPE_LOOKUP, "cube")
 
     def _extract_size(self, prompt: str) -> float:
         """Extract size hint from prompt"""
-        if any(word in prompt for word in ["small", "tiny", "mini"]):
-            return 0.5
-        elif any(word in prompt for word in ["large", "big", "huge", "giant"]):
-            return 2.0
-        else:
-            return 1.0
-
-    def _create_cube(self, size: float = 1.0) -> tuple[np.ndarray, np.ndarray]:
-        """Create cube geometry"""
-        s = size / 2
-        vertices = np.array([
-            [-s, -s, -s], [s, -s, -s], [s, s, -s], [-s, s, -s],  # bottom
-            [-s, -s, s], [s, -s, s], [s, s, s], [-s, s, s]       # top
-        ], dtype=np.float32)
-
-        faces = np.array([
-            [0, 1, 2], [0, 2, 3],  # bottom
-            [4, 7, 6], [4, 6, 5],  # top
-            [0, 4, 5], [0, 5, 1],  # front
-            [2, 6, 7], [2, 7, 3],  # back
-            [0, 3, 7], [0, 7, 4],  # left
-            [1, 5, 6], [1, 6, 2]   # right
-        ], dtype=np.uint32)
-
-        return vertices, faces
-
-    def _create_sphere(self, size: float = 1.0) -> tuple[np.ndarray, np.ndarray]:
-        """Create sphere geometry using UV sphere method"""
-        radius = size / 2
-        lat_segments = 16
-        lon_segments = 32
-
-        vertices = []
-        faces = []
-
-        # Generate vertices
-        for i in range(lat_segments + 1):
-            lat = np.pi * (-0.5 + float(i) / lat_segments)
-            for j in range(lon_segments + 1):
-                lon = 2 * np.pi * float(j) / lon_segments
-
-                x = radius * np.cos(lat) * np.cos(lon)
-                y = radius * np.sin(lat)
-                z = radius * np.cos(lat) * np.sin(lon)
-
-                vertices.append([x, y, z])
-
-        # Generate faces
-        for i in range(lat_segments):
-            for j in range(lon_segments):
-                first = i * (lon_segments + 1) + j
-                second = first + lon_segments + 1
-
-                faces.append([first, second, first + 1])
-                faces.append([second, second + 1, first + 1])
-
-        return np.array(vertices, dtype=np.float32), np.array(faces, dtype=np.uint32)
-
-    def _create_cylinder(self, size: float = 1.0) -> tuple[np.ndarray, np.ndarray]:
-        """Create cylinder geometry"""
-        radius = size / 2
-        height = size
-        segments = 16
-
-        vertices = []
-        faces = []
-
-        # Bottom center
-        vertices.append([0, -height/2, 0])
-        # Top center
-        vertices.append([0, height/2, 0])
-
-        # Bottom and top ring vertices
-        for i in range(segments):
-            angle = 2 * np.pi * i / segments
-            x = radius * np.cos(angle)
-            z = radius * np.sin(angle)
-
-            vertices.append([x, -height/2, z])  # bottom ring
-            vertices.append([x, height/2, z])   # top ring
-
-        # Bottom faces
-        for i in range(segments):
-            next_i = (i + 1) % segments
-            faces.append([0, 2 + i * 2, 2 + next_i * 2])
-
-        # Top faces
-        for i in range(segments):
-            next_i = (i + 1) % segments
-            faces.append([1, 3 + next_i * 2, 3 + i * 2])
-
-        # Side faces
-        for i in range(segments):
-            next_i = (i + 1) % segments
-
-            # Bottom triangle
-            faces.append([2 + i * 2, 3 + i * 2, 2 + next_i * 2])
-            # Top triangle
-            faces.append([3 + i * 2, 3 + next_i * 2, 2 + next_i * 2])
-
-        return np.array(vertices, dtype=np.float32), np.array(faces, dtype=np.uint32)
-
-    def _create_pyramid(self, size: float = 1.0) -> tuple[np.ndarray, np.ndarray]:
-        """Create pyramid geometry"""
-        s = size / 2
-        h = size
-
-        vertices = np.array([
-            # Base vertices
-            [-s, -h/2, -s],
-            [s, -h/2, -s],
-            [s, -h/2, s],
-            [-s, -h/2, s],
-            # Apex
-            [0, h/2, 0]
-        ], dtype=np.float32)
-
-        faces = np.array([
-            # Base
-            [0, 1, 2], [0, 2, 3],
-            # Sides
-            [0, 4, 1], [1, 4, 2], [2, 4, 3], [3, 4, 0]
-        ], dtype=np.uint32)
-
-        return vertices, faces
\ No newline at end of file
+        return _lookup_keyword(prompt, _SIZE_LOOKUP, 1.0)
+
+
+# Demo primitives scale linearly with size and their topology never changes,
+# so each is built once at unit size and scaled per request. Vertices are
+# float32 (what STL stores) and faces int32, matching mesh_utils.FACE_DTYPE
+def _build_cube(size: float = 1.0) -> tuple[np.ndarray, np.ndarray]:
+    """Build cube geometry"""
+    s = size / 2
+    vertices = np.array([
+        [-s, -s, -s], [s, -s, -s], [s, s, -s], [-s, s, -s],  # bottom
+        [-s, -s, s], [s, -s, s], [s, s, s], [-s, s, s]       # top
+    ], dtype=np.float32)
+
+    faces = np.array([
+        [0, 1, 2], [0, 2, 3],  # bottom
+        [4, 7, 6], [4, 6, 5],  # top
+        [0, 4, 5], [0, 5, 1],  # front
+        [2, 6, 7], [2, 7, 3],  # back
+        [0, 3, 7], [0, 7, 4],  # left
+        [1, 5, 6], [1, 6, 2]   # right
+    ], dtype=np.int32)
+
+    return vertices, faces
+
+def _build_sphere(size: float = 1.0, lat_segments: int = 16, lon_segments: int = 32) -> tuple[np.ndarray, np.ndarray]:
+    """Build closed UV sphere geometry (one vertex per pole, no seam duplicates)"""
+    radius = size / 2
+
+    # South pole, the interior latitude rings, then the north pole
+    lat = np.linspace(-np.pi / 2, np.pi / 2, lat_segments + 1)[1:-1]
+    lon = 2 * np.pi * np.arange(lon_segments) / lon_segments
+    lat, lon = np.meshgrid(lat, lon, indexing="ij")
+
+    ring_vertices = np.stack([
+        radius * np.cos(lat) * np.cos(lon),
+        radius * np.sin(lat),
+        radius * np.cos(lat) * np.sin(lon)
+    ], axis=-1).reshape(-1, 3)
+    vertices = np.concatenate([[[0, -radius, 0]], ring_vertices, [[0, radius, 0]]])
+    north = len(vertices) - 1
+
+    # Two faces per cell between adjacent rings, wrapping around the seam
+    i, j = np.meshgrid(np.arange(lat_segments - 2), np.arange(lon_segments), indexing="ij")
+    first = (1 + i * lon_segments + j).ravel()
+    first_next = (1 + i * lon_segments + (j + 1) % lon_segments).ravel()
+    second, second_next = first + lon_segments, first_next + lon_segments
+    ring_faces = np.stack([
+        np.stack([first, second, first_next], axis=-1),
+        np.stack([second, second_next, first_next], axis=-1)
+    ], axis=1).reshape(-1, 3)
+
+    # Triangle fans closing each pole
+    j = np.arange(lon_segments)
+    south_ring, south_next = 1 + j, 1 + (j + 1) % lon_segments
+    north_ring, north_next = south_ring + (lat_segments - 2) * lon_segments, south_next + (lat_segments - 2) * lon_segments
+    south_faces = np.stack([south_ring, south_next, np.zeros_like(j)], axis=-1)
+    north_faces = np.stack([north_ring, np.full_like(j, north), north_next], axis=-1)
+
+    faces = np.concatenate([south_faces, ring_faces, north_faces])
+
+    return vertices.astype(np.float32), faces.astype(np.int32)
+
+def _build_cylinder(size: float = 1.0, segments: int = 16) -> tuple[np.ndarray, np.ndarray]:
+    """Build cylinder geometry"""
+    radius = size / 2
+    height = size
+
+    # Bottom center, top center, then interleaved bottom/top ring vertices
+    angles = 2 * np.pi * np.arange(segments) / segments
+    x = radius * np.cos(angles)
+    z = radius * np.sin(angles)
+
+    vertices = np.empty((2 + 2 * segments, 3), dtype=np.float32)
+    vertices[0] = [0, -height/2, 0]
+    vertices[1] = [0, height/2, 0]
+    vertices[2::2] = np.stack([x, np.full_like(x, -height/2), z], axis=-1)  # bottom ring
+    vertices[3::2] = np.stack([x, np.full_like(x, height/2), z], axis=-1)   # top ring
+
+    i = np.arange(segments)
+    next_i = (i + 1) % segments
+    bottom = 2 + i * 2
+    bottom_next = 2 + next_i * 2
+
+    bottom_faces = np.stack([np.zeros_like(i), bottom, bottom_next], axis=-1)
+    top_faces = np.stack([np.ones_like(i), bottom_next + 1, bottom + 1], axis=-1)
+    # Two triangles per side quad, interleaved as (bottom, top) per segment
+    side_faces = np.stack([
+        np.stack([bottom, bottom + 1, bottom_next], axis=-1),
+        np.stack([bottom + 1, bottom_next + 1, bottom_next], axis=-1)
+    ], axis=1).reshape(-1, 3)
+
+    faces = np.concatenate([bottom_faces, top_faces, side_faces]).astype(np.int32)
+
+    return vertices, faces
+
+def _build_pyramid(size: float = 1.0) -> tuple[np.ndarray, np.ndarray]:
+    """Build pyramid geometry"""
+    s = size / 2
+    h = size
+
+    vertices = np.array([
+        # Base vertices
+        [-s, -h/2, -s],
+        [s, -h/2, -s],
+        [s, -h/2, s],
+        [-s, -h/2, s],
+        # Apex
+        [0, h/2, 0]
+    ], dtype=np.float32)
+
+    faces = np.array([
+        # Base
+        [0, 1, 2], [0, 2, 3],
+        # Sides
+        [0, 4, 1], [1, 4, 2], [2, 4, 3], [3, 4, 0]
+    ], dtype=np.int32)
+
+    return vertices, faces
+
+def _freeze(geometry: tuple[np.ndarray, np.ndarray]) -> tuple[np.ndarray, np.ndarray]:
+    """Mark cached geometry read-only so callers can't corrupt it"""
+    for array in geometry:
+        array.flags.writeable = False
+    return geometry
+
+_UNIT_CUBE = _freeze(_build_cube())
+_UNIT_SPHERE = _freeze(_build_sphere())
+_UNIT_CYLINDER = _freeze(_build_cylinder())
+_UNIT_PYRAMID = _freeze(_build_pyramid())
+_UNIT_SHAPES = {
+    "cube": _UNIT_CUBE,
+    "sphere": _UNIT_SPHERE,
+    "cylinder": _UNIT_CYLINDER,
+    "pyramid": _UNIT_PYRAMID
+}
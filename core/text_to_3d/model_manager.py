@@ -1,5 +1,8 @@
-from typing import Dict, List, Optional, Any
+from typing import Callable, Dict, List, Optional, Any
 import logging
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 from .base_model import BaseText3DModel, DemoText3DModel
@@ -13,37 +16,81 @@ class ModelManager:
         self.models_dir = Path(models_dir) if models_dir else Path("models/pretrained")
         self.models_dir.mkdir(parents=True, exist_ok=True)
 
+        # Models are constructed from their factory on first use
+        self._factories: Dict[str, Callable[[], BaseText3DModel]] = {}
         self._models: Dict[str, BaseText3DModel] = {}
+        # _lock guards the registries; construction and weight loading take a
+        # per-model lock so a slow load doesn't block other models
+        self._lock = threading.Lock()
+        self._model_locks: Dict[str, threading.Lock] = {}
         self._load_default_models()
 
     def _load_default_models(self):
-        """Load default available models"""
-        # Always load demo model
-        demo_model = DemoText3DModel()
-        self.register_model("demo", demo_model)
+        """Register default available models"""
+        # Always register demo model
+        self.register_factory("demo", DemoText3DModel)
 
         # TODO: Add other models when dependencies are available
         # self._try_load_point_e()
         # self._try_load_shap_e()
 
-        logger.info(f"Loaded {len(self._models)} models: {list(self._models.keys())}")
+        logger.info(f"Registered {len(self._factories)} models: {list(self._factories.keys())}")
+
+    def register_factory(self, name: str, factory: Callable[[], BaseText3DModel]):
+        """Register a model to be constructed lazily on first use"""
+        with self._lock:
+            self._factories[name] = factory
+            self._models.pop(name, None)
+        logger.info(f"Registered model: {name}")
 
     def register_model(self, name: str, model: BaseText3DModel):
-        """Register a new model"""
-        self._models[name] = model
+        """Register an already constructed model"""
+        with self._lock:
+            self._factories[name] = lambda: model
+            self._models[name] = model
         logger.info(f"Registered model: {name}")
 
+    def _model_lock(self, name: str) -> threading.Lock:
+        """Get the lock serializing construction and loading of one model"""
+        with self._lock:
+            return self._model_locks.setdefault(name, threading.Lock())
+
     def get_model(self, name: str) -> Optional[BaseText3DModel]:
-        """Get a model by name"""
-        return self._models.get(name)
+        """Get a model by name, constructing it on first use"""
+        model = self._models.get(name)
+        if model is not None or name not in self._factories:
+            return model
+
+        with self._model_lock(name):
+            model = self._models.get(name)
+            if model is None:
+                factory = self._factories.get(name)
+                if factory is None:
+                    return None
+                model = factory()
+                with self._lock:
+                    self._models[name] = model
+            return model
+
+    def _ensure_loaded(self, name: str, model: BaseText3DModel):
+        """Load a model's weights once, even under concurrent requests"""
+        if model.is_loaded:
+            return
+
+        with self._model_lock(name):
+            if not model.is_loaded:
+                logger.info(f"Loading model: {name}")
+                if not model.load_model():
+                    raise RuntimeError(f"Failed to load model: {name}")
 
     def get_available_models(self) -> List[Dict[str, Any]]:
         """Get list of available models with their info"""
         models_info = []
 
-        for name, model in self._models.items():
+        for name in list(self._factories):
             try:
-                info = model.get_model_info()
+                model = self._models.get(name)
+                info = model.get_model_info() if model is not None else self._unconstructed_model_info(name)
                 info.update({
                     "description": self._get_model_description(name),
                     "supported_formats": ["stl", "obj", "ply"],
@@ -56,8 +103,22 @@ class ModelManager:
 
         return models_info
 
-    def generate_3d(self, model_name: str, prompt: str, **kwargs) -> Dict[str, Any]:
-        """Generate 3D model using specified model"""
+    def _unconstructed_model_info(self, name: str) -> Dict[str, Any]:
+        """Model info for a registered model that hasn't been constructed yet
+
+        Factories are only registered for models whose dependencies are
+        present, so these are reported as available but not loaded.
+        """
+        return {
+            "name": name,
+            "loaded": False,
+            "available": True,
+            "device": "unknown",
+            "model_path": None
+        }
+
+    def _get_ready_model(self, model_name: str) -> BaseText3DModel:
+        """Get a model by name, checking availability and loading it if needed"""
         model = self.get_model(model_name)
         if not model:
             raise ValueError(f"Model '{model_name}' not found")
@@ -65,13 +126,14 @@ class ModelManager:
         if not model.is_available():
             raise RuntimeError(f"Model '{model_name}' is not available")
 
-        try:
-            # Ensure model is loaded
-            if not model.is_loaded:
-                logger.info(f"Loading model: {model_name}")
-                if not model.load_model():
-                    raise RuntimeError(f"Failed to load model: {model_name}")
+        self._ensure_loaded(model_name, model)
+        return model
+
+    def generate_3d(self, model_name: str, prompt: str, **kwargs) -> Dict[str, Any]:
+        """Generate 3D model using specified model"""
+        model = self._get_ready_model(model_name)
 
+        try:
             # Generate 3D model
             result = model.generate_3d(prompt, **kwargs)
 
@@ -86,6 +148,33 @@ class ModelManager:
             logger.error(f"Generation failed with model {model_name}: {e}")
             raise
 
+    def generate_3d_batch(self, model_name: str, prompts: List[str], **kwargs) -> List[Dict[str, Any]]:
+        """Generate 3D models for several prompts with one model lookup and load check"""
+        model = self._get_ready_model(model_name)
+
+        try:
+            results = model.generate_3d_batch(prompts, **kwargs)
+
+            for prompt, result in zip(prompts, results):
+                result["metadata"]["model_used"] = model_name
+                result["metadata"]["prompt"] = prompt
+                result["metadata"]["generation_params"] = kwargs
+
+            return results
+
+        except Exception as e:
+            logger.error(f"Generation failed with model {model_name}: {e}")
+            raise
+
+    def generate_many(self, model_name: str, prompts: List[str], **kwargs) -> List[Dict[str, Any]]:
+        """Generate several 3D models in parallel, returning results in prompt order"""
+        if len(prompts) <= 1:
+            return [self.generate_3d(model_name, prompt, **kwargs) for prompt in prompts]
+
+        max_workers = min(len(prompts), os.cpu_count() or 1)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(lambda prompt: self.generate_3d(model_name, prompt, **kwargs), prompts))
+
     def _get_model_description(self, name: str) -> str:
         """Get human-readable description for a model"""
         descriptions = {
@@ -128,23 +217,27 @@ class ModelManager:
             self.unload_model(name)
 
     def get_model_stats(self) -> Dict[str, Any]:
-        """Get statistics about loaded models"""
-        stats = {
-            "total_models": len(self._models),
-            "available_models": sum(1 for m in self._models.values() if m.is_available()),
-            "loaded_models": sum(1 for m in self._models.values() if m.is_loaded),
-            "models": {}
+        """Get statistics about registered models, without constructing any"""
+        models = {}
+        for name in list(self._factories):
+            model = self._models.get(name)
+            if model is None:
+                info = self._unconstructed_model_info(name)
+                models[name] = {"available": info["available"], "loaded": info["loaded"], "device": info["device"]}
+            else:
+                models[name] = {
+                    "available": model.is_available(),
+                    "loaded": model.is_loaded,
+                    "device": getattr(model, 'device', 'unknown')
+                }
+
+        return {
+            "total_models": len(models),
+            "available_models": sum(1 for m in models.values() if m["available"]),
+            "loaded_models": sum(1 for m in models.values() if m["loaded"]),
+            "models": models
         }
 
-        for name, model in self._models.items():
-            stats["models"][name] = {
-                "available": model.is_available(),
-                "loaded": model.is_loaded,
-                "device": getattr(model, 'device', 'unknown')
-            }
-
-        return stats
-
     # TODO: Implement these when AI model dependencies are available
     def _try_load_point_e(self):
         """Try to load Point-E model"""
@@ -175,12 +268,15 @@ class ModelManager:
 
 # Global model manager instance
 _model_manager = None
+_model_manager_lock = threading.Lock()
 
 def get_model_manager() -> ModelManager:
     """Get the global model manager instance"""
     global _model_manager
     if _model_manager is None:
-        _model_manager = ModelManager()
+        with _model_manager_lock:
+            if _model_manager is None:
+                _model_manager = ModelManager()
     return _model_manager
 
 def generate_3d_model(model_name: str, prompt: str, **kwargs) -> Dict[str, Any]:
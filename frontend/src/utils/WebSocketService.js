@@ -40,7 +40,12 @@ class WebSocketService {
         try {
           const data = JSON.parse(event.data)
           console.log('WebSocket message received:', data)
-          this.emit('message', data)
+          // The server batches bursts of updates into a single frame
+          if (data.type === 'multi') {
+            data.items.forEach(item => this.emit('message', item))
+          } else {
+            this.emit('message', data)
+          }
         } catch (error) {
           console.error('Failed to parse WebSocket message:', error)
           this.emit('message', { raw: event.data })
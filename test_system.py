@@ -4,14 +4,61 @@ Test script to verify AI 3D Generator system functionality
 """
 import sys
 import os
+import io
+import threading
+from concurrent.futures import ThreadPoolExecutor
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
 from core.text_to_3d.model_manager import get_model_manager
 from core.mesh_processing.mesh_utils import MeshProcessor
-import logging
+import numpy as np
 
-logging.basicConfig(level=logging.INFO)
-logger = logging.getLogger(__name__)
+# Generated meshes keyed by (model, prompt), shared between (concurrent) tests
+_gen_cache = {}
+_gen_cache_lock = threading.Lock()
+
+def _cached_generate_batch(model_name, prompts):
+    """Generate meshes for prompts, reusing any generated earlier in this run"""
+    with _gen_cache_lock:
+        missing = [prompt for prompt in dict.fromkeys(prompts) if (model_name, prompt) not in _gen_cache]
+        if missing:
+            results = get_model_manager().generate_3d_batch(model_name, missing)
+            for prompt, result in zip(missing, results):
+                _gen_cache[(model_name, prompt)] = result
+        return [_gen_cache[(model_name, prompt)] for prompt in prompts]
+
+def _cached_generate(model_name, prompt):
+    """Generate a mesh for prompt, reusing one generated earlier in this run"""
+    return _cached_generate_batch(model_name, [prompt])[0]
+
+class _ThreadOutput(io.TextIOBase):
+    """stdout proxy that sends each thread's output to its own buffer, if it has one"""
+
+    def __init__(self, stream):
+        self.stream = stream
+        self.local = threading.local()
+
+    def write(self, text):
+        buffer = getattr(self.local, "buffer", None)
+        return (buffer or self.stream).write(text)
+
+    def flush(self):
+        self.stream.flush()
+
+def _run_captured(output, test_func):
+    """Run a test with its output captured, returning (result, output text, error)"""
+    output.local.buffer = io.StringIO()
+    try:
+        return test_func(), output.local.buffer.getvalue(), None
+    except Exception as e:
+        return False, output.local.buffer.getvalue(), e
+    finally:
+        output.local.buffer = None
+
+def _write_lines(lines):
+    """Write buffered output lines to stdout in a single call"""
+    if lines:
+        sys.stdout.write("\n".join(lines) + "\n")
 
 def test_model_manager():
     """Test the model manager functionality"""
@@ -35,8 +82,6 @@ def test_generation():
     """Test 3D model generation"""
     print("\n🎨 Testing 3D Generation...")
 
-    manager = get_model_manager()
-
     test_prompts = [
         ("a red cube", "cube"),
         ("a blue sphere", "sphere"),
@@ -44,44 +89,63 @@ def test_generation():
         ("a yellow pyramid", "pyramid")
     ]
 
-    for prompt, expected_shape in test_prompts:
+    try:
+        results = _cached_generate_batch("demo", [prompt for prompt, _ in test_prompts])
+    except Exception as e:
+        print(f"   ❌ Generation failed: {e}")
+        return False
+
+    # Per-prompt output is collected and written once instead of printed line by line
+    lines = []
+    for (prompt, expected_shape), result in zip(test_prompts, results):
         try:
-            print(f"   Generating: '{prompt}'")
-            result = manager.generate_3d("demo", prompt)
+            lines.append(f"   Generating: '{prompt}'")
 
             vertices = result["vertices"]
             faces = result["faces"]
             metadata = result["metadata"]
 
-            print(f"   ✅ Generated {metadata.get('shape_type', 'unknown')} with {len(vertices)} vertices, {len(faces)} faces")
+            lines.append(f"   ✅ Generated {metadata.get('shape_type', 'unknown')} with {len(vertices)} vertices, {len(faces)} faces")
 
             # Validate mesh
             validation = MeshProcessor.validate_mesh(vertices, faces)
             if validation["is_valid"]:
-                print(f"      ✅ Mesh is valid")
+                lines.append(f"      ✅ Mesh is valid")
             else:
-                print(f"      ❌ Mesh validation failed: {validation['errors']}")
+                lines.append("      ❌ Mesh validation failed: " + "; ".join(validation["errors"]))
 
         except Exception as e:
-            print(f"   ❌ Generation failed: {e}")
+            lines.append(f"   ❌ Generation failed: {e}")
+            _write_lines(lines)
             return False
 
+    _write_lines(lines)
+
+    # Build every STL mesh in one shared buffer
+    try:
+        stl_meshes = MeshProcessor.create_meshes_batch([(r["vertices"], r["faces"]) for r in results])
+        print(f"   ✅ Built {len(stl_meshes)} STL meshes in one batch")
+    except Exception as e:
+        print(f"   ❌ Batched STL mesh creation failed: {e}")
+        return False
+
     return True
 
 def test_mesh_processing():
     """Test mesh processing utilities"""
     print("\n🔧 Testing Mesh Processing...")
 
-    manager = get_model_manager()
-
-    # Generate a simple cube for testing
-    result = manager.generate_3d("demo", "a simple cube")
+    # Reuse the cube from test_generation when it has already run
+    result = _cached_generate("demo", "a red cube")
     vertices = result["vertices"]
     faces = result["faces"]
 
+    # Gather the triangles once for both mesh creation and validation
+    triangles = MeshProcessor.prepare_triangles(vertices, faces)
+
     # Test mesh creation
     try:
-        stl_mesh = MeshProcessor.create_mesh_from_arrays(vertices, faces)
+        stl_mesh = MeshProcessor.create_mesh_from_arrays(vertices, faces, triangles=triangles)
         print("   ✅ STL mesh creation successful")
     except Exception as e:
         print(f"   ❌ STL mesh creation failed: {e}")
@@ -89,7 +153,7 @@ def test_mesh_processing():
 
     # Test mesh validation
     try:
-        validation = MeshProcessor.validate_mesh(vertices, faces)
+        validation = MeshProcessor.validate_mesh(vertices, faces, triangles=triangles)
         print(f"   ✅ Mesh validation: {validation['is_valid']}")
         print(f"      Stats: {validation['stats']}")
     except Exception as e:
@@ -98,9 +162,22 @@ def test_mesh_processing():
 
     # Test mesh operations
     try:
-        centered_vertices = MeshProcessor.center_mesh(vertices.copy())
-        scaled_vertices = MeshProcessor.scale_mesh(vertices.copy(), 2.0)
-        normalized_vertices = MeshProcessor.normalize_mesh_size(vertices.copy())
+        # One scratch allocation holds all three results; the cached input is never written
+        scratch = np.empty((3,) + vertices.shape, dtype=vertices.dtype)
+        centered_vertices = MeshProcessor.center_mesh(vertices, out=scratch[0])
+        scaled_vertices = MeshProcessor.scale_mesh(vertices, 2.0, out=scratch[1])
+        normalized_vertices = MeshProcessor.normalize_mesh_size(vertices, out=scratch[2])
+
+        # Same operations on the structure-of-arrays layout, which work in place
+        centered_soa = MeshProcessor.center_mesh(MeshProcessor.to_soa(vertices))
+        scaled_soa = MeshProcessor.scale_mesh(MeshProcessor.to_soa(vertices), 2.0)
+        normalized_soa = MeshProcessor.normalize_mesh_size(MeshProcessor.to_soa(vertices))
+
+        for aos, soa in [(centered_vertices, centered_soa), (scaled_vertices, scaled_soa),
+                         (normalized_vertices, normalized_soa)]:
+            if not np.allclose(aos, MeshProcessor.as_aos(soa), atol=1e-6):
+                print("   ❌ Structure-of-arrays results differ from (N, 3) results")
+                return False
 
         print("   ✅ Mesh operations (center, scale, normalize) successful")
     except Exception as e:
@@ -109,8 +186,45 @@ def test_mesh_processing():
 
     return True
 
+def _generation_body(manager, prompt):
+    """One generation + validation round, the unit timed by the benchmark"""
+    result = manager.generate_3d("demo", prompt)
+    return MeshProcessor.validate_mesh(result["vertices"], result["faces"])
+
+def _mesh_processing_body(vertices, faces):
+    """One mesh build, validation and transform round, the unit timed by the benchmark"""
+    triangles = MeshProcessor.prepare_triangles(vertices, faces)
+    MeshProcessor.create_mesh_from_arrays(vertices, faces, triangles=triangles)
+    MeshProcessor.validate_mesh(vertices, faces, triangles=triangles)
+    return MeshProcessor.transform_mesh(vertices, target_size=2.0)
+
+def benchmark(number):
+    """Time the generation and mesh processing bodies with timeit (BENCH=<iterations>)"""
+    import timeit
+
+    manager = get_model_manager()
+    result = _cached_generate("demo", "a red cube")
+    cases = [
+        ("generate + validate", lambda: _generation_body(manager, "a red cube")),
+        ("mesh processing", lambda: _mesh_processing_body(result["vertices"], result["faces"]))
+    ]
+
+    print(f"⏱️  Benchmark ({number} iterations each)")
+    for name, body in cases:
+        body()  # warm up caches (and the JIT when running under PyPy)
+        elapsed = timeit.timeit(body, number=number)
+        print(f"   {name}: {elapsed:.3f}s total, {elapsed / number * 1e6:.1f}µs per iteration")
+    return 0
+
 def main():
     """Run all tests"""
+    # BENCH=0 (like an unset BENCH) runs the normal tests
+    bench = os.environ.get("BENCH")
+    if bench:
+        number = int(bench) if bench.isdigit() else 1000
+        if number > 0:
+            return benchmark(number)
+
     print("🚀 AI 3D Generator System Test\n" + "="*40)
 
     tests = [
@@ -122,15 +236,25 @@ def main():
     passed = 0
     total = len(tests)
 
-    for test_name, test_func in tests:
-        try:
-            if test_func():
-                print(f"\n✅ {test_name} - PASSED")
-                passed += 1
-            else:
-                print(f"\n❌ {test_name} - FAILED")
-        except Exception as e:
-            print(f"\n💥 {test_name} - ERROR: {e}")
+    # Tests are independent, so run them concurrently and report in order
+    output = _ThreadOutput(sys.stdout)
+    sys.stdout = output
+    try:
+        with ThreadPoolExecutor(max_workers=total) as executor:
+            futures = [executor.submit(_run_captured, output, test_func) for _, test_func in tests]
+            outcomes = [future.result() for future in futures]
+    finally:
+        sys.stdout = output.stream
+
+    for (test_name, _), (result, text, error) in zip(tests, outcomes):
+        sys.stdout.write(text)
+        if error is not None:
+            print(f"\n💥 {test_name} - ERROR: {error}")
+        elif result:
+            print(f"\n✅ {test_name} - PASSED")
+            passed += 1
+        else:
+            print(f"\n❌ {test_name} - FAILED")
 
     print("\n" + "="*40)
     print(f"🎯 Test Results: {passed}/{total} tests passed")
@@ -0,0 +1,100 @@
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import asyncio
+
+import orjson
+import pytest
+
+from api import main
+from api.main import ConnectionManager, serialize_message
+
+class FakeWebSocket:
+    """Records sent frames; sends can be held open or made to fail"""
+
+    def __init__(self, fail: bool = False):
+        self.frames = []
+        self.fail = fail
+        self.gate = asyncio.Event()
+        self.gate.set()
+
+    async def accept(self):
+        pass
+
+    async def send_text(self, message: str):
+        if self.fail:
+            raise ConnectionResetError("client went away")
+        await self.gate.wait()
+        self.frames.append(orjson.loads(message))
+
+def _progress(job_id: str, progress: int) -> str:
+    return serialize_message({"job_id": job_id, "progress": progress})
+
+@pytest.fixture(autouse=True)
+def fast_flush(monkeypatch):
+    monkeypatch.setattr(main, "BROADCAST_FLUSH_INTERVAL", 0.01)
+
+def test_slow_client_only_gets_latest_payload_per_job():
+    async def run():
+        manager = ConnectionManager()
+        websocket = FakeWebSocket()
+        await manager.connect(websocket)
+
+        # Hold the first send open while more updates arrive
+        websocket.gate.clear()
+        await manager.broadcast(_progress("a", 10), job_id="a")
+        await asyncio.sleep(0)
+        for progress in (20, 30, 40):
+            await manager.broadcast(_progress("a", progress), job_id="a")
+        await manager.broadcast(_progress("b", 5), job_id="b")
+
+        websocket.gate.set()
+        await asyncio.sleep(0.05)
+        manager.disconnect(websocket)
+
+        assert websocket.frames == [
+            {"job_id": "a", "progress": 10},
+            {"type": "multi", "items": [{"job_id": "a", "progress": 40}, {"job_id": "b", "progress": 5}]}
+        ]
+
+    asyncio.run(run())
+
+def test_burst_is_sent_as_one_multi_frame():
+    async def run():
+        manager = ConnectionManager()
+        websocket = FakeWebSocket()
+        await manager.connect(websocket)
+
+        for job_id in ("a", "b", "c"):
+            await manager.broadcast(_progress(job_id, 50), job_id=job_id)
+        await asyncio.sleep(0.05)
+        manager.disconnect(websocket)
+
+        assert len(websocket.frames) == 1
+        assert websocket.frames[0]["type"] == "multi"
+        assert [item["job_id"] for item in websocket.frames[0]["items"]] == ["a", "b", "c"]
+
+    asyncio.run(run())
+
+def test_failed_send_removes_client():
+    async def run():
+        manager = ConnectionManager()
+        broken, healthy = FakeWebSocket(fail=True), FakeWebSocket()
+        await manager.connect(broken)
+        await manager.connect(healthy)
+
+        await manager.broadcast(_progress("a", 10), job_id="a")
+        await asyncio.sleep(0.05)
+
+        assert manager.active_connections == {healthy}
+        assert healthy.frames == [{"job_id": "a", "progress": 10}]
+
+        # Later broadcasts skip the pruned client
+        await manager.broadcast(_progress("a", 20), job_id="a")
+        await asyncio.sleep(0.05)
+        manager.disconnect(healthy)
+
+        assert healthy.frames[-1] == {"job_id": "a", "progress": 20}
+
+    asyncio.run(run())
@@ -0,0 +1,68 @@
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import asyncio
+
+import pytest
+
+from api.job_store import InMemoryJobStore, RedisJobStore
+
+async def _finish_jobs(store, tmp_path, count, start=0):
+    """Create and complete jobs that each own an output file"""
+    paths = []
+    for i in range(start, start + count):
+        path = tmp_path / f"job{i}_model.stl"
+        path.touch()
+        paths.append(path)
+        await store.create(f"job{i}", {"status": "queued"})
+        await store.update(f"job{i}", {"status": "completed", "file_path": str(path)})
+    return paths
+
+def test_in_memory_eviction_removes_output_files(tmp_path):
+    async def run():
+        store = InMemoryJobStore(max_finished_jobs=2)
+        paths = await _finish_jobs(store, tmp_path, 2)
+
+        # Touch job0 so job1 becomes the least recently used
+        assert await store.get("job0") is not None
+        paths += await _finish_jobs(store, tmp_path, 1, start=2)
+
+        assert await store.get("job1") is None
+        assert not paths[1].exists()
+        assert await store.get("job0") is not None
+        assert paths[0].exists()
+        assert paths[2].exists()
+
+    asyncio.run(run())
+
+def test_in_memory_active_jobs_are_not_evicted(tmp_path):
+    async def run():
+        store = InMemoryJobStore(max_finished_jobs=1)
+        await store.create("active", {"status": "processing"})
+        paths = await _finish_jobs(store, tmp_path, 3)
+
+        assert await store.get("active") is not None
+        assert [path.exists() for path in paths] == [False, False, True]
+
+    asyncio.run(run())
+
+def test_redis_eviction_removes_output_files(tmp_path):
+    fakeredis = pytest.importorskip("fakeredis")
+
+    async def run():
+        client = fakeredis.aioredis.FakeRedis(decode_responses=True)
+        store = RedisJobStore(client, max_finished_jobs=2)
+        paths = await _finish_jobs(store, tmp_path, 4)
+
+        assert [path.exists() for path in paths] == [False, False, True, True]
+        assert await store.get("job0") is None
+        assert await store.get("job3") is not None
+
+        # A negative TTL expires every finished job on the next sweep
+        store.finished_job_ttl = -1
+        await store.sweep()
+        assert not any(path.exists() for path in paths)
+        await client.aclose()
+
+    asyncio.run(run())
@@ -0,0 +1,65 @@
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+import pytest
+
+pytest.importorskip("numba")
+
+from core.mesh_processing import _kernels
+from core.mesh_processing.mesh_utils import MeshProcessor, _bounds
+from core.text_to_3d.base_model import DemoText3DModel
+
+def _kernel_and_numpy(monkeypatch, fn):
+    """Run fn once through the Numba kernels and once through the NumPy paths"""
+    monkeypatch.setattr(_kernels, "NUMBA_MIN_FACES", 1)
+    kernel_result = fn()
+    monkeypatch.setattr(_kernels, "NUMBA_MIN_FACES", sys.maxsize)
+    return kernel_result, fn()
+
+@pytest.fixture
+def sphere_with_degenerates():
+    result = DemoText3DModel().generate_3d("a large sphere")
+    vertices, faces = result["vertices"], result["faces"]
+    # A repeated-index face and a zero-area face between coincident vertices
+    vertices = np.concatenate([vertices, vertices[:1]])
+    faces = np.concatenate([faces, [[0, 0, 1], [0, len(vertices) - 1, 2]]]).astype(np.int32)
+    return vertices, faces
+
+def test_surface_area_kernel(monkeypatch, sphere_with_degenerates):
+    vertices, faces = sphere_with_degenerates
+    kernel, numpy = _kernel_and_numpy(monkeypatch, lambda: MeshProcessor._estimate_surface_area(vertices, faces))
+    assert kernel == pytest.approx(numpy, rel=1e-5)
+
+def test_volume_kernel(monkeypatch, sphere_with_degenerates):
+    vertices, faces = sphere_with_degenerates
+    kernel, numpy = _kernel_and_numpy(monkeypatch, lambda: MeshProcessor._estimate_volume(vertices, faces))
+    assert kernel == pytest.approx(numpy, rel=1e-5)
+
+def test_degenerate_face_count_kernel(monkeypatch, sphere_with_degenerates):
+    vertices, faces = sphere_with_degenerates
+    kernel, numpy = _kernel_and_numpy(monkeypatch, lambda: MeshProcessor._count_degenerate_faces(vertices, faces))
+    assert kernel == numpy == 2
+
+@pytest.mark.parametrize("offset", [0.0, 100.0, -100.0])
+def test_bounds_kernel(monkeypatch, offset):
+    vertices = (np.random.default_rng(0).standard_normal((1000, 3)) + offset).astype(np.float32)
+    (kernel_min, kernel_max), (numpy_min, numpy_max) = _kernel_and_numpy(monkeypatch, lambda: _bounds(vertices))
+    np.testing.assert_array_equal(kernel_min, numpy_min)
+    np.testing.assert_array_equal(kernel_max, numpy_max)
+
+@pytest.mark.parametrize("dtype", [np.float32, np.float64, np.int32, np.int64])
+def test_center_kernel(monkeypatch, dtype):
+    vertices = np.random.default_rng(0).integers(-1000, 1000, (1000, 3)).astype(dtype)
+    kernel, numpy = _kernel_and_numpy(monkeypatch, lambda: MeshProcessor.center_mesh(vertices))
+    assert kernel.dtype == numpy.dtype
+    np.testing.assert_allclose(kernel, numpy, rtol=1e-5, atol=1e-3)
+
+def test_validate_mesh_kernel_path(monkeypatch, sphere_with_degenerates):
+    vertices, faces = sphere_with_degenerates
+    kernel, numpy = _kernel_and_numpy(monkeypatch, lambda: MeshProcessor.validate_mesh(vertices, faces)["stats"])
+    assert kernel["degenerate_faces"] == numpy["degenerate_faces"]
+    assert kernel["bounding_box"] == numpy["bounding_box"]
+    assert kernel["surface_area"] == pytest.approx(numpy["surface_area"], rel=1e-5)
+    assert kernel["volume"] == pytest.approx(numpy["volume"], rel=1e-5)
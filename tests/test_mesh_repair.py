@@ -0,0 +1,72 @@
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+import pytest
+import trimesh
+
+from core.mesh_processing.mesh_utils import MeshProcessor
+from core.text_to_3d.base_model import DemoText3DModel
+
+@pytest.fixture
+def cube():
+    result = DemoText3DModel().generate_3d("a cube")
+    return result["vertices"], result["faces"]
+
+def _face_set(vertices, faces):
+    """Faces as a set of sorted corner coordinates, independent of vertex order"""
+    return {tuple(sorted(map(tuple, np.round(vertices[face], 6)))) for face in faces}
+
+def test_repair_merges_duplicate_vertices(cube):
+    vertices, faces = cube
+    # Triangle soup: every face has its own three vertices
+    soup_vertices = vertices[faces].reshape(-1, 3)
+    soup_faces = np.arange(len(soup_vertices)).reshape(-1, 3)
+
+    repaired_vertices, repaired_faces = MeshProcessor.repair_mesh(soup_vertices, soup_faces)
+
+    assert len(repaired_vertices) == 8
+    assert len(repaired_faces) == 12
+    assert _face_set(repaired_vertices, repaired_faces) == _face_set(vertices, faces)
+    assert trimesh.Trimesh(repaired_vertices, repaired_faces, process=False).is_watertight
+
+def test_repair_drops_bad_faces(cube):
+    vertices, faces = cube
+    # Extra vertex on the edge between vertices 0 and 1, for a zero-area face
+    vertices = np.concatenate([vertices, (vertices[:1] + vertices[1:2]) / 2])
+    bad_faces = np.array([
+        [0, 0, 1],           # repeated index
+        [0, 8, 1],           # collinear corners
+        faces[0],            # duplicate
+        faces[1][::-1],      # duplicate with reversed winding
+        [0, 1, 99],          # out of range
+        [-1, 1, 2]           # negative index
+    ])
+
+    repaired_vertices, repaired_faces = MeshProcessor.repair_mesh(vertices, np.concatenate([faces, bad_faces]))
+
+    assert repaired_faces.dtype == np.int32
+    assert len(repaired_faces) == 12
+    assert _face_set(repaired_vertices, repaired_faces) == _face_set(vertices, faces)
+
+def test_optimize_reaches_target_faces():
+    pytest.importorskip("fast_simplification")
+    result = DemoText3DModel().generate_3d("a sphere")
+    vertices, faces = result["vertices"], result["faces"]
+
+    optimized_vertices, optimized_faces = MeshProcessor.optimize_mesh(vertices, faces, target_faces=200)
+
+    assert len(optimized_faces) <= 200
+    assert optimized_vertices.dtype == vertices.dtype
+    assert optimized_faces.dtype == faces.dtype
+    assert optimized_faces.max() < len(optimized_vertices)
+
+@pytest.mark.parametrize("target_faces", [None, 12, 100])
+def test_optimize_without_reduction_returns_input(cube, target_faces):
+    vertices, faces = cube
+
+    optimized_vertices, optimized_faces = MeshProcessor.optimize_mesh(vertices, faces, target_faces=target_faces)
+
+    assert optimized_vertices is vertices
+    assert optimized_faces is faces
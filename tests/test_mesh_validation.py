@@ -0,0 +1,33 @@
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+
+from api.utils import MeshProcessor as ApiMeshProcessor
+from core.mesh_processing.mesh_utils import MeshProcessor
+from core.text_to_3d.base_model import DemoText3DModel
+
+@pytest.mark.parametrize("create", [
+    lambda: ApiMeshProcessor.create_cube(2.0),
+    lambda: ApiMeshProcessor.create_sphere(2.0),
+    lambda: ApiMeshProcessor.create_cylinder()
+])
+def test_closed_primitives_validate_cleanly(create):
+    result = ApiMeshProcessor.validate_mesh(create())
+
+    assert result["errors"] == []
+    assert result["is_manifold"]
+    assert result["is_watertight"]
+    assert result["surface_area"] > 0
+    assert result["volume"] != 0
+
+@pytest.mark.parametrize("prompt", ["a cube", "a sphere", "a cylinder", "a pyramid"])
+def test_deep_validation_of_closed_demo_shapes(prompt):
+    result = DemoText3DModel().generate_3d(prompt)
+    validation = MeshProcessor.validate_mesh(result["vertices"], result["faces"], deep=True)
+
+    assert validation["is_valid"]
+    assert validation["warnings"] == []
+    assert validation["stats"]["is_manifold"]
+    assert validation["stats"]["is_watertight"]
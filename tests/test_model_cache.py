@@ -0,0 +1,77 @@
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+from api import main, utils
+from api.utils import FileManager, ModelCache
+
+def test_cache_hit_hardlinks_file(tmp_path, monkeypatch):
+    cache = ModelCache()
+    monkeypatch.setattr(main, "model_cache", cache)
+
+    cached_file = tmp_path / "job1_model.stl"
+    cached_file.write_bytes(b"solid cube\nendsolid cube\n")
+    cache.put(ModelCache.make_key("a cube", "demo", "stl"), str(cached_file))
+
+    output_file = asyncio.run(main.create_ai_generated_model("a cube", "job2", "demo", "stl"))
+
+    assert output_file == str(tmp_path / "job2_model.stl")
+    assert os.path.samefile(output_file, cached_file)
+    assert os.stat(cached_file).st_nlink == 2
+
+def test_non_demo_models_bypass_cache(tmp_path, monkeypatch):
+    cache = ModelCache()
+    monkeypatch.setattr(main, "model_cache", cache)
+    cached_file = tmp_path / "job1_model.stl"
+    cached_file.touch()
+    cache.put(ModelCache.make_key("a cube", "shap-e", "stl"), str(cached_file))
+
+    generated_file = str(tmp_path / "job2_generated.stl")
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        monkeypatch.setattr(main, "get_generation_executor", lambda: executor)
+        monkeypatch.setattr(main, "_generate_model_file", lambda *args: generated_file)
+        output_file = asyncio.run(main.create_ai_generated_model("a cube", "job2", "shap-e", "stl"))
+
+    assert output_file == generated_file
+    assert cache.get(ModelCache.make_key("a cube", "shap-e", "stl")) == str(cached_file)
+
+def test_demo_primitives_do_not_share_core_demo_entries(tmp_path, monkeypatch):
+    cache = ModelCache()
+    monkeypatch.setattr(utils, "model_cache", cache)
+    monkeypatch.setattr(utils, "file_manager", FileManager(str(tmp_path / "generated")))
+    core_file = tmp_path / "job1_model.stl"
+    core_file.touch()
+    cache.put(ModelCache.make_key("a cube", "demo", "stl"), str(core_file))
+
+    output_path = utils.create_demo_model("a cube", "job2")
+
+    assert not os.path.samefile(output_path, core_file)
+    assert os.path.getsize(output_path) > 0
+
+def test_cache_drops_entries_with_missing_file(tmp_path):
+    cache = ModelCache()
+    key = ModelCache.make_key("a cube")
+    cache.put(key, str(tmp_path / "missing.stl"))
+
+    assert cache.get(key) is None
+    assert key not in cache._entries
+
+def test_cache_evicts_least_recently_used(tmp_path):
+    cache = ModelCache(max_entries=2)
+    paths = []
+    for name in ("a", "b", "c"):
+        path = tmp_path / f"{name}.stl"
+        path.touch()
+        paths.append(str(path))
+
+    cache.put("a", paths[0])
+    cache.put("b", paths[1])
+    cache.get("a")
+    cache.put("c", paths[2])
+
+    assert cache.get("a") == paths[0]
+    assert cache.get("b") is None
+    assert cache.get("c") == paths[2]
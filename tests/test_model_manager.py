@@ -0,0 +1,97 @@
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from core.text_to_3d.base_model import DemoText3DModel
+from core.text_to_3d.model_manager import ModelManager
+
+class SlowLoadingModel(DemoText3DModel):
+    """Demo model whose weight load blocks until released"""
+
+    def __init__(self, release: threading.Event):
+        super().__init__()
+        self.is_loaded = False
+        self.release = release
+
+    def load_model(self) -> bool:
+        self.release.wait(timeout=5)
+        self.is_loaded = True
+        return True
+
+@pytest.fixture
+def manager(tmp_path):
+    return ModelManager(models_dir=str(tmp_path))
+
+def test_concurrent_get_model_runs_factory_once(manager):
+    calls = []
+
+    def factory():
+        calls.append(1)
+        time.sleep(0.05)
+        return DemoText3DModel()
+
+    manager.register_factory("slow", factory)
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        models = list(executor.map(lambda _: manager.get_model("slow"), range(8)))
+
+    assert len(calls) == 1
+    assert all(model is models[0] for model in models)
+
+def test_slow_load_does_not_block_other_models(manager):
+    release = threading.Event()
+    manager.register_factory("slow", lambda: SlowLoadingModel(release))
+    manager.register_factory("other", DemoText3DModel)
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        loading = executor.submit(manager.generate_3d, "slow", "a cube")
+        time.sleep(0.05)
+        try:
+            assert manager.generate_3d("other", "a sphere")["metadata"]["shape_type"] == "sphere"
+            assert not loading.done()
+        finally:
+            release.set()
+        assert loading.result(timeout=5)["metadata"]["model_used"] == "slow"
+
+def test_stats_do_not_construct_models(manager):
+    calls = []
+    manager.register_factory("lazy", lambda: calls.append(1) or DemoText3DModel())
+
+    stats = manager.get_model_stats()
+    names = [info["name"] for info in manager.get_available_models()]
+
+    assert calls == []
+    assert stats["total_models"] == 2
+    assert stats["models"]["lazy"] == {"available": True, "loaded": False, "device": "unknown"}
+    assert names == ["demo", "lazy"]
+
+    manager.get_model("lazy")
+    assert manager.get_model_stats()["models"]["lazy"]["loaded"]
+
+def test_unknown_model_is_none(manager):
+    assert manager.get_model("missing") is None
+    with pytest.raises(ValueError):
+        manager.generate_3d("missing", "a cube")
+
+class StaggeredModel(DemoText3DModel):
+    """Demo model where earlier prompts take longer, so they finish last"""
+
+    def generate_3d(self, prompt: str, **kwargs):
+        time.sleep(0.01 * int(prompt.split()[-1]))
+        return super().generate_3d(prompt, **kwargs)
+
+def test_generate_many_returns_results_in_prompt_order(manager):
+    manager.register_model("staggered", StaggeredModel())
+    shapes = ["sphere", "cube", "cylinder", "pyramid"]
+    prompts = [f"a {shape} {len(shapes) - i}" for i, shape in enumerate(shapes)]
+
+    results = manager.generate_many("staggered", prompts, quality="low")
+
+    assert [result["metadata"]["prompt"] for result in results] == prompts
+    assert [result["metadata"]["shape_type"] for result in results] == shapes
+    assert all(result["metadata"]["generation_params"] == {"quality": "low"} for result in results)
@@ -0,0 +1,22 @@
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+
+from api.utils import PromptProcessor
+
+@pytest.mark.parametrize("prompt, shape, size", [
+    ("a big red ball", "sphere", 2.0),
+    ("a tiny tube", "cylinder", 0.5),
+    ("a box", "cube", 1.0),
+    ("something", "cube", 1.0),
+    # Overlapping keywords: "round" inside "cylinderound" still wins
+    ("a cylinderound thing", "sphere", 1.0),
+    ("a minimal huge pipe", "cylinder", 0.5)
+])
+def test_extract_shape_hints(prompt, shape, size):
+    hints = PromptProcessor.extract_shape_hints(prompt)
+
+    assert hints["primary_shape"] == shape
+    assert hints["size"] == size
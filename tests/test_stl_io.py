@@ -0,0 +1,56 @@
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+import pytest
+from stl import mesh
+
+from api.utils import load_stl_fast
+from core.mesh_processing.mesh_utils import MeshProcessor
+from core.text_to_3d.base_model import DemoText3DModel
+
+@pytest.fixture
+def cube():
+    result = DemoText3DModel().generate_3d("a cube")
+    return result["vertices"], result["faces"]
+
+@pytest.mark.parametrize("ascii", [False, True])
+def test_write_stl_triangles_round_trip(tmp_path, cube, ascii):
+    vertices, faces = cube
+    triangles = vertices[faces]
+    path = tmp_path / "cube.stl"
+
+    MeshProcessor.write_stl_triangles(triangles, str(path), ascii=ascii)
+    if ascii:
+        assert path.read_bytes().lstrip().startswith(b"solid")
+    else:
+        assert path.stat().st_size == 84 + 50 * len(faces)
+    loaded = mesh.Mesh.from_file(str(path))
+
+    assert len(loaded.vectors) == len(faces)
+    np.testing.assert_allclose(loaded.vectors, triangles, atol=1e-5)
+    np.testing.assert_allclose(np.linalg.norm(loaded.normals, axis=1), 1.0, atol=1e-5)
+
+@pytest.mark.parametrize("ascii", [False, True])
+def test_write_stl_round_trip(tmp_path, cube, ascii):
+    vertices, faces = cube
+    path = tmp_path / "cube.stl"
+
+    MeshProcessor.write_stl(vertices, faces, str(path), ascii=ascii)
+    loaded = mesh.Mesh.from_file(str(path))
+
+    np.testing.assert_allclose(loaded.vectors, vertices[faces], atol=1e-5)
+
+@pytest.mark.parametrize("ascii", [False, True])
+def test_load_stl_fast(tmp_path, cube, ascii):
+    vertices, faces = cube
+    path = tmp_path / "cube.stl"
+    MeshProcessor.write_stl(vertices, faces, str(path), ascii=ascii)
+
+    loaded = load_stl_fast(str(path))
+    expected = mesh.Mesh.from_file(str(path))
+
+    assert len(loaded.vectors) == len(faces)
+    np.testing.assert_array_equal(loaded.vectors, expected.vectors)
+    np.testing.assert_array_equal(loaded.normals, expected.normals)